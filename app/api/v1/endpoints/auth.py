@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
+from app.core.login_cache import forget_access_token
 from app.core.security import JWT
 
 from .schemas.login import LoginRequest
@@ -44,7 +45,7 @@ async def login(response: Response, user_data: LoginRequest, service: UserServic
 
 
 @router.post("/logout", status_code=status.HTTP_200_OK, dependencies=[Depends(get_current_user_from_cookie)])
-async def logout(response: Response) -> StatusMessageResponse:
+async def logout(request: Request, response: Response) -> StatusMessageResponse:
     """
     Log the user out by deleting the cookie with token cookie.
 
@@ -52,11 +53,16 @@ async def logout(response: Response) -> StatusMessageResponse:
     ensures that the request includes a valid access token.
 
     Args:
+        request (Request): The current HTTP request, used to access the token cookie.
         response (Response): The HTTP response object used to clear the cookie.
 
     Returns:
         StatusMessageResponse: A response containing a message indicating that the user has logged out.
     """
+    access_token = request.cookies.get("access_token")
+    if access_token:
+        forget_access_token(access_token)
+
     response.delete_cookie(
         "access_token",
         path="/",
@@ -36,6 +36,8 @@ class DatabaseSettings(BaseSettings):
         name (str): The name of the database.
         host (str): The database server's hostname or IP address.
         port (int): The port number on which the database server is listening.
+        pool_size (int): The number of connections kept open in the connection pool.
+        max_overflow (int): The number of extra connections allowed above 'pool_size' during bursts.
     """
 
     driver: str = Field(alias="DATABASE_DRIVER", default="postgresql+asyncpg")
@@ -44,6 +46,8 @@ class DatabaseSettings(BaseSettings):
     name: str = Field(alias="DATABASE_NAME", default="mydb")
     host: str = Field(alias="DATABASE_HOST", default="localhost")
     port: int = Field(alias="DATABASE_PORT", default=5432)
+    pool_size: int = Field(alias="DATABASE_POOL_SIZE", default=10)
+    max_overflow: int = Field(alias="DATABASE_MAX_OVERFLOW", default=2)
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -35,8 +35,33 @@ def create_session_factory() -> async_sessionmaker[AsyncSession]:
         port=database_settings.port,
         database=database_settings.name,
     )
-    engine = create_async_engine(connection_url, pool_size=10, max_overflow=2)
+    engine = create_async_engine(
+        connection_url,
+        pool_size=database_settings.pool_size,
+        max_overflow=database_settings.max_overflow,
+    )
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def create_readonly_session_factory(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Create a session factory for read-only lookups on top of an existing session factory.
+
+    Sessions from this factory share the connection pool of the given factory, but their
+    connections run in autocommit mode, so a single SELECT does not need extra BEGIN and
+    COMMIT round trips. Use it only for reads: every statement is committed on its own.
+
+    Args:
+        session_factory (async_sessionmaker[AsyncSession]): The session factory whose engine is reused.
+
+    Returns:
+        async_sessionmaker: A session factory for creating autocommit instances of AsyncSession.
+    """
+    engine = session_factory.kw["bind"].execution_options(isolation_level="AUTOCOMMIT")
     return async_sessionmaker(engine, expire_on_commit=False)
 
 
 async_session_factory = create_session_factory()
+readonly_session_factory = create_readonly_session_factory(async_session_factory)
@@ -1,3 +1,4 @@
+import functools
 from ipaddress import IPv4Address, IPv6Address
 
 from geoip2.database import Reader
@@ -5,11 +6,16 @@ from geoip2.errors import AddressNotFoundError
 
 from app.models.proxy import Location
 
+GEOLOCATION_CACHE_SIZE = 65536
+
 
 class GeoIP:
     """
     A wrapper around the GeoIP2 database for retrieving geolocation data.
 
+    Lookups are memoized per instance, so repeated addresses (e.g. the same host listed
+    with several ports or protocols) skip the database tree walk.
+
     Attributes:
         reader (Reader): The GeoIP2 database reader instance.
     """
@@ -22,11 +28,26 @@ class GeoIP:
             databasefile (str, optional): Path to the GeoIP2 database file. Defaults to "GeoLite2-City.mmdb".
         """
         self.reader = Reader(databasefile)
+        self._cached_geolocation = functools.lru_cache(maxsize=GEOLOCATION_CACHE_SIZE)(self._lookup_geolocation)
 
     def get_geolocation(self, ip: IPv4Address | IPv6Address) -> Location | None:
         """
         Retrieve geolocation information for a given IP address.
 
+        Both found locations and misses are cached.
+
+        Args:
+            ip (IPv4Address | IPv6Address): The IP address to look up.
+
+        Returns:
+            Location | None: A Location object if geolocation data is available, otherwise None.
+        """
+        return self._cached_geolocation(ip)
+
+    def _lookup_geolocation(self, ip: IPv4Address | IPv6Address) -> Location | None:
+        """
+        Look up geolocation information for a given IP address in the database.
+
         Args:
             ip (IPv4Address | IPv6Address): The IP address to look up.
 
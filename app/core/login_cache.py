@@ -0,0 +1,64 @@
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+LOGGED_IN_CACHE_SIZE = 4096
+LOGGED_IN_CACHE_TTL = 15.0  # seconds
+
+# access token -> (user id, unix expiry time), kept in least recently used order
+_logged_in_cache: OrderedDict[str, tuple[UUID, float]] = OrderedDict()
+
+
+def get_cached_user_id(access_token: str) -> UUID | None:
+    """
+    Look up the user of an access token in the logged-in cache.
+
+    Args:
+        access_token (str): The access token to look up.
+
+    Returns:
+        UUID | None: The ID of the user the token belongs to, or None if the token is not cached or has expired.
+    """
+    cached = _logged_in_cache.get(access_token)
+    if not cached:
+        return None
+
+    user_id, expiry = cached
+    if expiry <= time.time():
+        del _logged_in_cache[access_token]
+        return None
+
+    _logged_in_cache.move_to_end(access_token)
+    return user_id
+
+
+def remember_access_token(access_token: str, user_id: UUID, token_expiry: float) -> None:
+    """
+    Store a verified access token in the logged-in cache.
+
+    The entry expires after a short time, but never later than the token itself.
+
+    Args:
+        access_token (str): The verified access token.
+        user_id (UUID): The ID of the user the token belongs to.
+        token_expiry (float): The expiration time of the token as a unix timestamp.
+    """
+    _logged_in_cache[access_token] = (user_id, min(time.time() + LOGGED_IN_CACHE_TTL, token_expiry))
+    _logged_in_cache.move_to_end(access_token)
+    if len(_logged_in_cache) > LOGGED_IN_CACHE_SIZE:
+        _logged_in_cache.popitem(last=False)
+
+
+def forget_access_token(access_token: str) -> None:
+    """
+    Drop an access token from the logged-in cache.
+
+    Args:
+        access_token (str): The access token to forget.
+    """
+    _logged_in_cache.pop(access_token, None)
+
+
+def clear_logged_in_cache() -> None:
+    """Drop all access tokens from the logged-in cache."""
+    _logged_in_cache.clear()
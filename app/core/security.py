@@ -117,6 +117,45 @@ class JWT:
         Returns:
             str: The user ID extracted from the token.
         """
+        payload = JWT._decode_payload(token)
+        return str(payload["sub"])
+
+    @staticmethod
+    def decode_with_expiry(token: str) -> tuple[str, float]:
+        """
+        Decode a JWT token and extract the user ID together with the token expiration time.
+
+        Args:
+            token (str): The JWT token to decode.
+
+        Raises:
+            TokenError: If the token is empty, expired, invalid, or lacks a user ID or an expiration time.
+
+        Returns:
+            tuple[str, float]: The user ID and the expiration time of the token as a unix timestamp.
+        """
+        payload = JWT._decode_payload(token)
+
+        expiry = payload.get("exp")
+        if expiry is None:
+            raise TokenError("Invalid token payload")
+
+        return str(payload["sub"]), float(expiry)
+
+    @staticmethod
+    def _decode_payload(token: str) -> dict[str, Any]:
+        """
+        Decode a JWT token and verify that it has a user ID.
+
+        Args:
+            token (str): The JWT token to decode.
+
+        Raises:
+            TokenError: If the token is empty, expired, invalid, or lacks a user ID.
+
+        Returns:
+            dict[str, Any]: The payload of the token.
+        """
         if not token:
             raise TokenError("Token is empty")
 
@@ -131,8 +170,7 @@ class JWT:
         except InvalidTokenError as exc:
             raise TokenError("Invalid token") from exc
 
-        user_id = payload.get("sub")
-        if not user_id:
+        if not payload.get("sub"):
             raise TokenError("Invalid token payload")
 
-        return str(user_id)
+        return payload
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import and_, distinct, func, insert, select, update
+from sqlalchemy import and_, distinct, func, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -146,6 +146,23 @@ class ProxyRepository(BaseRepository[Proxy]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_countries_by_codes(self, codes: list[str]) -> dict[str, Country]:
+        """
+        Retrieve multiple Country entities by their ISO 3166-1 alpha-2 codes in a single query.
+
+        Args:
+            codes (list[str]): The country codes.
+
+        Returns:
+            dict[str, Country]: The found Country entities keyed by their code. Unknown codes are omitted.
+        """
+        if not codes:
+            return {}
+
+        stmt = select(Country).where(Country.code.in_(codes))
+        result = await self.session.execute(stmt)
+        return {country.code: country for country in result.scalars().all()}
+
     async def add_geo_address(
         self,
         geo_address: ProxyAddress,
@@ -153,24 +170,17 @@ class ProxyRepository(BaseRepository[Proxy]):
         """
         Add a new ProxyAddress entity to the database.
 
+        Like 'add', the entity is only registered in the session, so it is flushed
+        together with other pending entities in a single flush.
+
         Args:
             geo_address (ProxyAddress): The ProxyAddress entity to add.
 
         Returns:
             ProxyAddress: The added ProxyAddress entity.
         """
-        stmt = (
-            insert(ProxyAddress)
-            .values(
-                id=geo_address.id,
-                country_id=geo_address.country_id,
-                region=geo_address.region,
-                city=geo_address.city,
-            )
-            .returning(ProxyAddress)
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+        self.session.add(geo_address)
+        return geo_address
 
     async def get_geo_address_by_id(self, id_: UUID) -> ProxyAddress | None:
         """
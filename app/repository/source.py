@@ -39,6 +39,18 @@ class SourceRepository(BaseRepository[Source]):
         self.session.add(entity)
         return entity
 
+    async def add_bulk(self, entities: list[Source]) -> None:
+        """
+        Add multiple Source entities to the database.
+
+        The entities are written in a single flush, which batches the inserts
+        of each table into one statement.
+
+        Args:
+            entities (list[Source]): The Source entities to add.
+        """
+        self.session.add_all(entities)
+
     async def get_by_id(self, id_: UUID) -> Source | None:
         """
         Retrieve a Source entity by its ID.
@@ -93,6 +105,31 @@ class SourceRepository(BaseRepository[Source]):
 
         return result.scalar_one()
 
+    async def update_bulk(self, entities: list[Source], *, only_health: bool = False) -> None:
+        """
+        Bulk update multiple Source entities and/or their associated SourceHealth records.
+
+        If 'only_health' is True, only the SourceHealth records are updated.
+        Otherwise, both Source and SourceHealth records are updated.
+
+        Args:
+            entities (list[Source]): A list of Source entities to update.
+            only_health (bool): If True, update only SourceHealth records. Defaults to False.
+        """
+        if not entities:
+            return
+
+        if not only_health:
+            source_values = [source.to_dict() for source in entities]
+
+            stmt = update(Source)
+            await self.session.execute(stmt, source_values)
+
+        source_health_values = [source.health.to_dict() for source in entities]
+
+        stmt = update(SourceHealth)
+        await self.session.execute(stmt, source_health_values)
+
     async def remove(self, entity: Source) -> None:
         """
         Remove a Source entity from the database.
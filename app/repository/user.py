@@ -48,9 +48,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User | None: The User entity if found, otherwise None.
         """
-        stmt = select(User).where(User.id == id_)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self.session.get(User, id_)
 
     async def get_by_login(self, login: str) -> User | None:
         """
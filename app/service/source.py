@@ -100,6 +100,17 @@ class SourceService:
         async with self.uow as uow:
             return await uow.source_repository.update(source)
 
+    async def update_bulk(self, sources: list[Source], *, only_health: bool = False) -> None:
+        """
+        Update multiple proxy sources at once.
+
+        Args:
+            sources (list[Source]): A list of proxy sources to update.
+            only_health (bool, optional): If True, update only health-related fields. Defaults to False.
+        """
+        async with self.uow as uow:
+            await uow.source_repository.update_bulk(sources, only_health=only_health)
+
     async def remove(self, source: Source) -> None:
         """
         Remove a proxy source from the database.
@@ -3,11 +3,12 @@ import logging
 
 from app.core.database import create_session_factory
 from app.core.uow import SQLUnitOfWork
-from app.models.proxy import Proxy
+from app.models.proxy import Protocol, Proxy
 from app.service.proxy import ProxyService
 
 from .utils.aws_check import check_proxy_with_aws
 from .utils.gather import cgather
+from .utils.network_request import graceful_shutdown
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,9 @@ async def check_proxies() -> None:
 
     proxies = await cgather(*tasks, limit=50)
 
+    # let ssl connections of all checks close before the event loop is shut down
+    await graceful_shutdown(Protocol.HTTPS)
+
     checked_proxies: list[Proxy] = []
 
     for proxy in proxies:
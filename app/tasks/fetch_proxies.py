@@ -1,9 +1,19 @@
+import asyncio
+import bisect
 import datetime
 import logging
-from ipaddress import IPv4Address, IPv6Address, ip_address
-from typing import Any
+import re
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from ipaddress import IPv4Address, IPv4Network, IPv6Address
+from typing import Any, Self
+
+import aiohttp
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.database import create_session_factory
+from app.core.exceptions import BaseError
 from app.core.geoip import GeoIP
 from app.core.uow import SQLUnitOfWork
 from app.models.proxy import Protocol
@@ -13,7 +23,7 @@ from app.service.source import SourceService
 
 from .utils.aws_check import check_proxy_with_aws
 from .utils.gather import cgather
-from .utils.network_request import HTTP_STATUS_OK, try_http_request
+from .utils.network_request import graceful_shutdown, http_request_lines
 
 type IPAddress = IPv4Address | IPv6Address
 
@@ -23,6 +33,98 @@ PORT_RANGE_END = 65535
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ProxyBatch:
+    """
+    Represent a batch of unchecked proxies stored as parallel arrays (structure of arrays).
+
+    Compared to a list of (ip, port, protocol) tuples, a batch does not allocate a tuple and an int
+    object per proxy: ports are packed into an unsigned 16-bit array and protocols are references
+    to the shared enum members.
+
+    Attributes:
+        addresses (list[IPAddress]): IP addresses of the proxies.
+        ports (array[int]): Ports of the proxies.
+        protocols (list[Protocol]): Protocols of the proxies.
+    """
+
+    addresses: list[IPAddress] = field(default_factory=list)
+    ports: array[int] = field(default_factory=lambda: array("H"))
+    protocols: list[Protocol] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """
+        Return the number of proxies in the batch.
+
+        Returns:
+            int: The number of proxies.
+        """
+        return len(self.addresses)
+
+    def __iter__(self) -> Iterator[tuple[IPAddress, int, Protocol]]:
+        """
+        Iterate over the batch row by row.
+
+        Returns:
+            Iterator[tuple[IPAddress, int, Protocol]]: An iterator of (ip, port, protocol) tuples.
+        """
+        return zip(self.addresses, self.ports, self.protocols, strict=True)
+
+    def __getitem__(self, index: slice) -> Self:
+        """
+        Return a sub-batch for the given slice.
+
+        Args:
+            index (slice): The slice of proxies to take.
+
+        Returns:
+            Self: A new batch containing the sliced proxies.
+        """
+        return type(self)(self.addresses[index], self.ports[index], self.protocols[index])
+
+    def append(self, address: IPAddress, port: int, protocol: Protocol) -> None:
+        """
+        Append a single proxy to the batch.
+
+        Args:
+            address (IPAddress): The IP address of the proxy.
+            port (int): The port of the proxy.
+            protocol (Protocol): The protocol of the proxy.
+        """
+        self.addresses.append(address)
+        self.ports.append(port)
+        self.protocols.append(protocol)
+
+    def extend(self, other: Self) -> None:
+        """
+        Append all proxies from another batch.
+
+        Args:
+            other (Self): The batch to take proxies from.
+        """
+        self.addresses.extend(other.addresses)
+        self.ports.extend(other.ports)
+        self.protocols.extend(other.protocols)
+
+    def deduplicated(self) -> Self:
+        """
+        Return a new batch without repeated proxies, keeping the first occurrence of each.
+
+        Returns:
+            Self: A new batch in which every (ip, port, protocol) row is unique.
+        """
+        unique = type(self)()
+        seen: set[tuple[IPAddress, int, Protocol]] = set()
+
+        for row in self:
+            if row in seen:
+                continue
+            seen.add(row)
+            unique.append(*row)
+
+        return unique
+
+
 def validate_port(port: int) -> None:
     """
     Validate that a given port number is within the valid TCP/UDP range.
@@ -37,15 +139,22 @@ def validate_port(port: int) -> None:
         raise ValueError("Valid port range is [1; 65535]")
 
 
-SCHEME_IP_PORT_LENGTH = 2  #  ip:port
-SCHEME_PROTOCOL_IOP_PORT_LENGTH = 3  #  protocol://ip:port
+# optional "protocol://" prefix, IPv4 octets without leading zeros and port,
+# surrounding whitespace (e.g. "\r") is ignored
+IP_PORT_PATTERN = re.compile(
+    r"\s*(?:[a-zA-Z][a-zA-Z0-9+.-]*://)?"
+    r"(0|[1-9]\d{0,2})\.(0|[1-9]\d{0,2})\.(0|[1-9]\d{0,2})\.(0|[1-9]\d{0,2}):(\d{1,5})\s*",
+)
+IPV4_OCTET_MAX = 255
 
 
 def try_parse_ip_port(proxy_line: str) -> tuple[IPAddress, int] | None:
     """
     Attempt to parse a proxy string in the format IP:PORT or protocol://IP:PORT.
 
-    Supports both IPv4 and IPv6 addresses (without square brackets).
+    Only IPv4 addresses are supported. The line is matched against a precompiled pattern
+    and the address is built from its integer value, which skips the string parsing
+    done by the 'ipaddress' module.
 
     Args:
         proxy_line (str): The proxy string to parse.
@@ -53,67 +162,172 @@ def try_parse_ip_port(proxy_line: str) -> tuple[IPAddress, int] | None:
     Returns:
         tuple[IPAddress, int] | None: A tuple of (IP address, port) if parsing is successful, otherwise None.
     """
-    try:
-        # TODO(sny): parse IPv6 with [2001:db8::1]:8080
-        substrings = proxy_line.split(":")
-        parts_length = len(substrings)
-
-        if parts_length == SCHEME_IP_PORT_LENGTH:
-            ip_str, port_str = substrings
-        elif parts_length == SCHEME_PROTOCOL_IOP_PORT_LENGTH:
-            _, ip_str, port_str = substrings  # omit protocol
-            ip_str = ip_str.lstrip("/")
+    # TODO(sny): parse IPv6 with [2001:db8::1]:8080
+    match = IP_PORT_PATTERN.fullmatch(proxy_line)
+    if not match:
+        return None
+
+    a, b, c, d, port = map(int, match.groups())
+    if a > IPV4_OCTET_MAX or b > IPV4_OCTET_MAX or c > IPV4_OCTET_MAX or d > IPV4_OCTET_MAX:
+        return None
+    if not (PORT_RANGE_START <= port <= PORT_RANGE_END):
+        return None
+
+    return (IPv4Address((a << 24) | (b << 16) | (c << 8) | d), port)
+
+
+# IPv4 networks that are not globally reachable, following the current IANA IPv4 Special-Purpose
+# Address Registry. The table does not depend on the interpreter: 'ipaddress.IPv4Address.is_global'
+# only treats the whole 192.0.0.0/24 as non-global since CPython 3.12.4
+NON_GLOBAL_IPV4_NETWORKS = (
+    IPv4Network("0.0.0.0/8"),
+    IPv4Network("10.0.0.0/8"),
+    IPv4Network("100.64.0.0/10"),
+    IPv4Network("127.0.0.0/8"),
+    IPv4Network("169.254.0.0/16"),
+    IPv4Network("172.16.0.0/12"),
+    IPv4Network("192.0.0.0/24"),
+    IPv4Network("192.0.2.0/24"),
+    IPv4Network("192.168.0.0/16"),
+    IPv4Network("198.18.0.0/15"),
+    IPv4Network("198.51.100.0/24"),
+    IPv4Network("203.0.113.0/24"),
+    IPv4Network("240.0.0.0/4"),
+)
+# globally reachable addresses inside the networks above
+NON_GLOBAL_IPV4_EXCEPTIONS = (
+    IPv4Address("192.0.0.9"),
+    IPv4Address("192.0.0.10"),
+)
+
+
+def build_address_ranges(
+    networks: Iterable[IPv4Network],
+    exceptions: Iterable[IPv4Address],
+) -> tuple[list[int], list[int]]:
+    """
+    Build sorted, disjoint integer ranges covering the given networks without the excepted addresses.
+
+    Args:
+        networks (Iterable[IPv4Network]): The networks to cover.
+        exceptions (Iterable[IPv4Address]): Addresses to leave out of the ranges.
+
+    Returns:
+        tuple[list[int], list[int]]: The first and the last address of every range,
+            as two parallel lists sorted by the first address.
+    """
+    ranges: list[tuple[int, int]] = []
+    for network in sorted(networks):
+        first, last = int(network.network_address), int(network.broadcast_address)
+        if ranges and first <= ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], max(ranges[-1][1], last))
         else:
-            return None
+            ranges.append((first, last))
 
-        ip = ip_address(ip_str)
-        port = int(port_str)
-        validate_port(port)
+    for exception in map(int, exceptions):
+        split: list[tuple[int, int]] = []
+        for first, last in ranges:
+            if not first <= exception <= last:
+                split.append((first, last))
+                continue
+            if first < exception:
+                split.append((first, exception - 1))
+            if exception < last:
+                split.append((exception + 1, last))
+        ranges = split
 
-    except ValueError:
-        return None
-    return (ip, port)
+    return [first for first, _ in ranges], [last for _, last in ranges]
 
 
-async def download_proxy_list(
-    url: str,
-    protocol: Protocol,
-) -> list[tuple[IPAddress, int, Protocol]] | None:
+NON_GLOBAL_IPV4_FIRSTS, NON_GLOBAL_IPV4_LASTS = build_address_ranges(
+    NON_GLOBAL_IPV4_NETWORKS,
+    NON_GLOBAL_IPV4_EXCEPTIONS,
+)
+
+
+def is_global_address(address: IPAddress) -> bool:
     """
-    Download a list of proxies from the given URL and parses them.
+    Check whether an IP address is globally reachable.
 
-    The URL is expected to return proxies in the format "IP:PORT" or "PROTOCOL://IP:PORT" per line.
+    'is_global' tests the address against every special-purpose network in Python code,
+    which dominates proxy list parsing. IPv4 addresses are instead looked up with a binary
+    search over the precomputed non-global ranges, so the result is the same on every Python version;
+    IPv6 addresses fall back to 'is_global'.
 
     Args:
-        url (str): The URL to download the proxy list from.
-        protocol (Protocol): The protocol type to associate with each proxy.
+        address (IPAddress): The IP address to check.
 
     Returns:
-        list[tuple[IPAddress, int, Protocol]] | None: A list of tuples containing IP, port, and protocol.
-            Returns None if the request fails or the response is invalid.
+        bool: True if the address is globally reachable, otherwise False.
     """
-    http_result = await try_http_request(url=url)
-    if not http_result:
-        logger.debug("Http request to '%s' failed", url)
-        return None
+    if isinstance(address, IPv6Address):
+        return address.is_global
 
-    if http_result.status != HTTP_STATUS_OK:
-        logger.debug("Http request to '%s' failed with status code %i", url, http_result.status)
-        return None
+    value = int(address)
+    index = bisect.bisect_right(NON_GLOBAL_IPV4_FIRSTS, value) - 1
+    return index < 0 or value > NON_GLOBAL_IPV4_LASTS[index]
+
+
+def parse_proxy_list(lines: Iterable[str], protocol: Protocol) -> ProxyBatch:
+    """
+    Parse lines of a downloaded proxy list, keeping only proxies with public IP addresses.
 
-    proxies: list[tuple[IPAddress, int, Protocol]] = []
+    Each line is expected to be in the format "IP:PORT" or "PROTOCOL://IP:PORT", invalid lines are skipped.
+
+    Args:
+        lines (Iterable[str]): The lines of a proxy list, one proxy per line.
+        protocol (Protocol): The protocol type to associate with each proxy.
+
+    Returns:
+        ProxyBatch: A batch containing IP, port, and protocol of the parsed proxies.
+    """
+    proxies = ProxyBatch()
 
-    lines = http_result.text.splitlines()
     for line in lines:
         parse_result = try_parse_ip_port(line)
         if not parse_result:
             continue
 
         # we need only public ip's
-        if not parse_result[0].is_global:
+        if not is_global_address(parse_result[0]):
             continue
 
-        proxies.append((*parse_result, protocol))
+        proxies.append(*parse_result, protocol)
+
+    return proxies
+
+
+async def download_proxy_list(
+    url: str,
+    protocol: Protocol,
+    session: aiohttp.ClientSession | None = None,
+) -> ProxyBatch:
+    """
+    Download a list of proxies from the given URL and parses them.
+
+    The URL is expected to return proxies in the format "IP:PORT" or "PROTOCOL://IP:PORT" per line.
+    The response is parsed while it is being received, without buffering the whole body.
+
+    Args:
+        url (str): The URL to download the proxy list from.
+        protocol (Protocol): The protocol type to associate with each proxy.
+        session (aiohttp.ClientSession | None, optional): An existing session to download with.
+            If omitted, a new session is created for this download.
+
+    Returns:
+        ProxyBatch: A batch containing IP, port, and protocol of the parsed proxies.
+            The batch is empty if the request fails or the response is invalid. A list that failed
+            midway is dropped as a whole, so the source is not counted as healthy.
+    """
+    proxies = ProxyBatch()
+
+    try:
+        async for lines in http_request_lines(url, session=session):
+            # parsing large lists is cpu-bound, so keep the event loop free for other downloads
+            proxies.extend(await asyncio.to_thread(parse_proxy_list, lines, protocol))
+    except (aiohttp.ClientError, TimeoutError, LookupError) as exc:
+        logger.debug("Proxy list download from '%s' failed", url, exc_info=exc)
+        return ProxyBatch()
 
     return proxies
 
@@ -143,62 +357,114 @@ async def check_proxy(
 async def fetch_all_proxy_lists(
     sources: list[Source],
     source_service: SourceService,
-) -> list[tuple[IPAddress, int, Protocol]]:
+) -> ProxyBatch:
     """
     Fetch and parse proxy lists from a set of source URLs.
 
-    Updates each source's connection attempt statistics.
+    Updates each source's connection attempt statistics, which are stored in a single bulk update.
+    All lists are downloaded through one HTTP session, so sources hosted on the same server
+    reuse its connections.
 
     Args:
         sources (list[Source]): List of proxy sources.
         source_service (SourceService): Service for updating source health.
 
     Returns:
-        list[tuple[IPAddress, int, Protocol]]: Combined list of unchecked proxies.
+        ProxyBatch: Combined batch of unchecked proxies. Proxies published by several sources
+            are included only once, so each of them is checked a single time.
     """
-    unchecked_proxies: list[tuple[IPAddress, int, Protocol]] = []
+    unchecked_proxies = ProxyBatch()
 
-    for source in sources:
-        proxy_list_result = await download_proxy_list(source.uri, source.uri_predefined_type)
+    async with aiohttp.ClientSession() as session:
+        for source in sources:
+            proxy_list_result = await download_proxy_list(source.uri, source.uri_predefined_type, session)
 
-        source.health.total_conn_attempts += 1
-        source.health.last_used = datetime.datetime.now(tz=datetime.timezone.utc)
-        if not proxy_list_result:
-            source.health.failed_conn_attempts += 1
+            source.health.total_conn_attempts += 1
+            source.health.last_used = datetime.datetime.now(tz=datetime.timezone.utc)
+            if not proxy_list_result:
+                source.health.failed_conn_attempts += 1
 
-        await source_service.update(source)
+            if proxy_list_result:
+                unchecked_proxies.extend(proxy_list_result)
 
-        if proxy_list_result:
-            unchecked_proxies.extend(proxy_list_result)
+    await source_service.update_bulk(sources, only_health=True)
 
-    return unchecked_proxies
+    return unchecked_proxies.deduplicated()
 
 
 async def check_list_of_proxies(
-    proxies: list[tuple[IPAddress, int, Protocol]],
+    proxies: ProxyBatch,
 ) -> list[tuple[IPAddress, int, Protocol, int, datetime.datetime]]:
     """
-    Asynchronously check a list of proxies for availability and latency.
+    Asynchronously check a batch of proxies for availability and latency.
 
     Args:
-        proxies (list[tuple[IPAddress, int, Protocol]]): A list of proxies to check.
+        proxies (ProxyBatch): A batch of proxies to check.
 
     Returns:
         list[tuple[IPAddress, int, Protocol, int, datetime.datetime]]:
             A list of successfully validated proxies with latency and test time.
     """
-    check_tasks = [check_proxy((proxy[0], proxy[1]), proxy[2]) for proxy in proxies]
+    check_tasks = [check_proxy((address, port), protocol) for address, port, protocol in proxies]
     return await cgather(*check_tasks, limit=50)
 
 
+async def store_checked_proxies(
+    proxies: ProxyBatch,
+    proxy_service: ProxyService,
+    geoip_service: GeoIP,
+    store_lock: asyncio.Lock,
+) -> None:
+    """
+    Check a chunk of proxies, resolve their geolocation, and save valid entries into the database.
+
+    Args:
+        proxies (ProxyBatch): A chunk of unchecked proxies.
+        proxy_service (ProxyService): Service for storing proxies.
+        geoip_service (GeoIP): Service for resolving proxy geolocation.
+        store_lock (asyncio.Lock): Lock shared by all chunks, so that only the checks run concurrently
+            and the chunks are saved one at a time.
+    """
+    checked_proxies = await check_list_of_proxies(proxies)
+    if not checked_proxies:
+        return
+
+    proxies_data: list[dict[str, Any]] = []
+
+    for ip, port, protocol, latency, last_tested in checked_proxies:
+        location = geoip_service.get_geolocation(ip)
+        if not location:
+            continue
+
+        proxies_data.append(
+            {
+                "address": ip,
+                "port": port,
+                "protocol": protocol,
+                "location": location,
+                "initial_health": InitialHealth(latency=latency, tested=last_tested),
+            },
+        )
+
+    if not proxies_data:
+        return
+
+    try:
+        # concurrent stores would race on creating the same geo addresses
+        async with store_lock:
+            await proxy_service.create_bulk(proxies_data)
+    except (SQLAlchemyError, BaseError):
+        logger.exception("Failed to store %d checked proxies", len(proxies_data))
+
+
 async def fetch_proxies() -> None:
     """
     Fetch, validate, and store publicly available proxies from various sources.
 
     This includes downloading raw proxy lists, validating them using AWS checks,
     determining geolocation, and saving valid entries into the database.
+    Unchecked proxies are checked in chunks, several chunks at a time, and stored one chunk at a time.
     """
-    # TODO(sny): split function into smaller functions
     session_factory = create_session_factory()
 
     source_service = SourceService(SQLUnitOfWork(session_factory, raise_exc=False))
@@ -213,32 +479,17 @@ async def fetch_proxies() -> None:
         logger.debug("No valid proxies found in proxy sources")
         return
 
-    proxy_service = ProxyService(SQLUnitOfWork(session_factory, raise_exc=False))
     geoip_service = GeoIP(databasefile="geoip/GeoLite2-City.mmdb")
 
-    chunk_size = 500
-    for i in range(0, len(unchecked_proxies), chunk_size):
-        chunk = unchecked_proxies[i : i + chunk_size]
-        checked_proxies = await check_list_of_proxies(chunk)
-        if not checked_proxies:
-            continue
-
-        proxies: list[dict[str, Any]] = []
-
-        for ip, port, protocol, latency, last_tested in checked_proxies:
-            location = geoip_service.get_geolocation(ip)
-            if not location:
-                continue
+    proxy_service = ProxyService(SQLUnitOfWork(session_factory, raise_exc=False))
+    store_lock = asyncio.Lock()
 
-            proxies.append(
-                {
-                    "address": ip,
-                    "port": port,
-                    "protocol": protocol,
-                    "location": location,
-                    "initial_health": InitialHealth(latency=latency, tested=last_tested),
-                },
-            )
-
-        if proxies:
-            await proxy_service.create_bulk(proxies)
+    chunk_size = 500
+    chunk_tasks = [
+        store_checked_proxies(unchecked_proxies[i : i + chunk_size], proxy_service, geoip_service, store_lock)
+        for i in range(0, len(unchecked_proxies), chunk_size)
+    ]
+    await cgather(*chunk_tasks, limit=4)
+
+    # let ssl connections of all checks close before the event loop is shut down
+    await graceful_shutdown(Protocol.HTTPS)
@@ -2,12 +2,32 @@ import asyncio
 import logging
 from ipaddress import IPv4Address, IPv6Address, ip_address
 
+import aiohttp
+
 from app.models.proxy import Protocol
 
-from .network_request import HTTP_STATUS_OK, ProxyHttpResult, try_http_request_with_proxy
+from .network_request import (
+    HTTP_STATUS_OK,
+    PROXY_ERRORS,
+    ProxyHttpResult,
+    create_proxy_session,
+    try_http_request_with_proxy,
+)
 
 logger = logging.getLogger(__name__)
 
+PROXY_URL_TEMPLATES = {
+    Protocol.HTTP: "http://{}:{}",
+    Protocol.HTTPS: "http://{}:{}",  # aiohttp support only http with tls
+    Protocol.SOCKS4: "socks4://{}:{}",
+    Protocol.SOCKS5: "socks5://{}:{}",
+}
+
+# only socks5 proxies support authentication
+PROXY_AUTH_URL_TEMPLATES = {
+    Protocol.SOCKS5: "socks5://{}:{}@{}:{}",
+}
+
 
 def format_proxy_url(
     address: IPv4Address | IPv6Address,
@@ -29,15 +49,10 @@ def format_proxy_url(
     Returns:
         str: A formatted proxy URL string.
     """
-    credentials = ""
-    if protocol == Protocol.SOCKS5 and login and password:
-        credentials = f"{login}:{password}@"
+    if login and password and (auth_template := PROXY_AUTH_URL_TEMPLATES.get(protocol)):
+        return auth_template.format(login, password, address, port)
 
-    protocol_value = protocol.value
-    if protocol == Protocol.HTTPS:  # aiohttp support only http with tls
-        protocol_value = "http"
-
-    return f"{protocol_value}://{credentials}{address}:{port}".lower()
+    return PROXY_URL_TEMPLATES[protocol].format(address, port)
 
 
 def validate_aws_response(address: IPv4Address | IPv6Address, response: ProxyHttpResult) -> bool:
@@ -54,8 +69,15 @@ def validate_aws_response(address: IPv4Address | IPv6Address, response: ProxyHtt
     if response.status != HTTP_STATUS_OK:
         return False
 
+    remote_address_text = response.text.strip("\r\n")
+
+    # fast path: the check service answers with the canonical text form of the address,
+    # so a plain string comparison is enough and no address needs to be parsed
+    if remote_address_text == str(address):
+        return True
+
     try:
-        remote_address = ip_address(response.text.strip("\r\n"))
+        remote_address = ip_address(remote_address_text)
     except ValueError:
         logger.debug("Invalid IP format in AWS response: %r", response.text)
         return False
@@ -72,6 +94,7 @@ async def try_aws_http_request_with_proxy(
     url: str,
     proxy_url: str,
     protocol: Protocol,
+    session: aiohttp.ClientSession | None = None,
 ) -> tuple[bool, int]:
     """
     Attempt a single HTTP request through a proxy and validate it via AWS IP check.
@@ -84,11 +107,12 @@ async def try_aws_http_request_with_proxy(
         url (str): The URL to request (e.g., AWS IP check URL).
         proxy_url (str): The full formatted proxy URL.
         protocol (Protocol): The protocol used by the proxy.
+        session (aiohttp.ClientSession | None, optional): An existing proxy session to reuse. Defaults to None.
 
     Returns:
         tuple[bool, int]: A tuple containing a success flag and the response time in milliseconds.
     """
-    response = await try_http_request_with_proxy(url, proxy_url, protocol)
+    response = await try_http_request_with_proxy(url, proxy_url, protocol, session=session)
     if not response or not validate_aws_response(address, response):
         return (False, 0)
     return (True, response.time)
@@ -105,7 +129,8 @@ async def check_proxy_with_aws(
     """
     Check if a proxy is functional and stable using AWS IP check.
 
-    Performs two requests with a delay in between to verify stability.
+    Performs two requests with a delay in between to verify stability. Both requests share
+    the same proxy session, so the second one reuses the already established connection.
 
     Args:
         address (IPv4Address | IPv6Address): The IP address of the proxy.
@@ -123,13 +148,19 @@ async def check_proxy_with_aws(
 
     proxy_url = format_proxy_url(address, port, protocol, login, password)
 
-    response = await try_aws_http_request_with_proxy(address, url, proxy_url, protocol)
-    if not response[0]:
-        return (False, 0)
+    try:
+        async with create_proxy_session(proxy_url, protocol) as session:
+            response = await try_aws_http_request_with_proxy(address, url, proxy_url, protocol, session)
+            if response[0]:
+                await asyncio.sleep(delay)  # delay between two requests to ensure proxy stability
 
-    await asyncio.sleep(delay)  # delay between two requests to ensure proxy stability
+                response = await try_aws_http_request_with_proxy(address, url, proxy_url, protocol, session)
+    except PROXY_ERRORS:
+        return (False, 0)
+    except Exception:  # noqa: BLE001
+        logger.debug("Proxy check failed for %s", proxy_url, exc_info=True)
+        return (False, 0)
 
-    response = await try_aws_http_request_with_proxy(address, url, proxy_url, protocol)
     if not response[0]:
         return (False, 0)
 
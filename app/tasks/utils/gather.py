@@ -5,13 +5,25 @@ from typing import TypeVar
 T = TypeVar("T")
 
 
+def _close(task: Awaitable[object]) -> None:
+    """
+    Close a coroutine that will never be awaited, so it does not warn about it when garbage collected.
+
+    Args:
+        task (Awaitable[object]): The awaitable to close. Anything but a coroutine is left untouched.
+    """
+    if asyncio.iscoroutine(task):
+        task.close()
+
+
 async def cgather(*tasks: Awaitable[T | None], limit: int = 50) -> list[T]:
     """
     Asynchronously gather results with a concurrency limit.
 
     This function allows running multiple asynchronous tasks concurrently, but limits the number of tasks
-    running at the same time based on the provided 'limit'. It filters out 'None' values and exceptions from
-    the results before returning.
+    running at the same time based on the provided 'limit'. Instead of wrapping every task, a fixed pool
+    of 'limit' workers pulls tasks from a shared queue, so only 'limit' asyncio tasks exist at any time.
+    It filters out 'None' values and exceptions from the results before returning.
 
     Args:
         *tasks (Awaitable[T | None]): The asynchronous tasks to run. Each task is expected
@@ -19,18 +31,41 @@ async def cgather(*tasks: Awaitable[T | None], limit: int = 50) -> list[T]:
         limit (int, optional): The maximum number of tasks to run concurrently. Default is 50.
 
     Returns:
-        list[T]: A list of results from the tasks, excluding any `None` values and exceptions.
+        list[T]: A list of results from the tasks in argument order, excluding any `None` values and exceptions.
+
+    Raises:
+        ValueError: If 'limit' is less than 1.
     """
-    semaphore = asyncio.Semaphore(limit)
+    if limit < 1:
+        for task in tasks:
+            _close(task)
+        message = f"Concurrency limit must be at least 1, got {limit}"
+        raise ValueError(message)
+
+    queue: asyncio.Queue[tuple[int, Awaitable[T | None]]] = asyncio.Queue()
+    for index, task in enumerate(tasks):
+        queue.put_nowait((index, task))
+
+    # every task writes its result into its own slot, so results keep the argument order
+    results: list[T | None] = [None] * len(tasks)
 
-    async def sem_task(task: Awaitable[T | None]) -> T | None:
-        async with semaphore:
-            return await task
+    async def worker() -> None:
+        while not queue.empty():
+            index, task = queue.get_nowait()
+            try:
+                results[index] = await task
+            except Exception:  # noqa: BLE001, S112
+                # filter out exceptions
+                continue
 
-    results = await asyncio.gather(
-        *[sem_task(task) for task in tasks],
-        return_exceptions=True,
-    )
+    try:
+        async with asyncio.TaskGroup() as group:
+            for _ in range(min(limit, len(tasks))):
+                group.create_task(worker())
+    finally:
+        # if the caller is cancelled, tasks that were not started yet are still in the queue
+        while not queue.empty():
+            _, task = queue.get_nowait()
+            _close(task)
 
-    # filter out exceptions
-    return [value for value in results if value is not None and not isinstance(value, BaseException)]
+    return [result for result in results if result is not None]
@@ -1,5 +1,8 @@
 import asyncio
+import codecs
 import logging
+import time
+from collections.abc import AsyncIterator
 from typing import NamedTuple
 
 import aiohttp
@@ -13,18 +16,17 @@ HTTP_STATUS_MULTIPLE_CHOICES = 300
 
 logger = logging.getLogger(__name__)
 
-
-class HttpResult(NamedTuple):
-    """
-    Represent the result of a direct HTTP request.
-
-    Attributes:
-        status (int): HTTP response status code.
-        text (str): Response body text if status is 2xx; otherwise empty string.
-    """
-
-    status: int
-    text: str
+# errors that only mean the proxy does not work, so they are not worth logging
+PROXY_ERRORS = (
+    aiohttp.client_exceptions.ClientError,
+    aiohttp.client_exceptions.ClientConnectorCertificateError,
+    aiohttp.client_exceptions.ClientConnectorSSLError,
+    # author of aiohttp_socks did not bother with proper exception wrapping
+    ProxyConnectionError,
+    ProxyError,
+    OSError,
+    asyncio.exceptions.IncompleteReadError,
+)
 
 
 class ProxyHttpResult(NamedTuple):
@@ -47,6 +49,8 @@ async def graceful_shutdown(protocol: Protocol | None = None) -> None:
     Ensure graceful shutdown of the aiohttp connection.
 
     For HTTPS, waits briefly to allow SSL connections to close properly.
+    Proxy checks do not wait for it on their own: the delay only matters before the event loop
+    is closed, so task entry points await it once after all checks are done.
     Refer to aiohttp docs:
     https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
 
@@ -61,34 +65,29 @@ async def graceful_shutdown(protocol: Protocol | None = None) -> None:
         await asyncio.sleep(0)
 
 
-async def try_http_request_with_proxy(
-    url: str,
+def create_proxy_session(
     proxy_url: str,
     protocol: Protocol,
     proxy_timeout: int = 10,
-) -> ProxyHttpResult | None:
+) -> aiohttp.ClientSession:
     """
-    Attempt to make an HTTP GET request through a given proxy.
+    Create an HTTP session bound to a given proxy.
 
-    This function supports both HTTP/HTTPS and SOCKS4/SOCKS5 proxies. It measures the
-    response time and optionally returns the response body for successful requests.
+    For SOCKS4/SOCKS5 proxies the session is backed by a ProxyConnector, for HTTP/HTTPS proxies
+    the proxy url has to be passed on each request. The session can be reused for several
+    requests through the same proxy, so that subsequent requests reuse the pooled connection.
 
     Args:
-        url (str): The target URL to perform a GET request on.
         proxy_url (str): The proxy server URL in format protocol://ip:port.
         protocol (Protocol): The protocol of the proxy (e.g., HTTP, SOCKS5).
         proxy_timeout (int, optional): Timeout in seconds for proxy connection and response. Defaults to 10.
 
     Returns:
-        ProxyHttpResult | None: A ProxyHttpResult object if the request was successful, None otherwise.
+        aiohttp.ClientSession: A client session configured for the proxy.
     """
-    proxy = None
     connector = None
-
     if protocol in (Protocol.SOCKS4, Protocol.SOCKS5):
         connector = ProxyConnector.from_url(proxy_url)
-    else:  # HTTP, HTTPS
-        proxy = proxy_url
 
     timeout = aiohttp.ClientTimeout(
         total=None,
@@ -97,63 +96,144 @@ async def try_http_request_with_proxy(
         sock_read=proxy_timeout,
     )
 
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+async def try_http_request_with_proxy(
+    url: str,
+    proxy_url: str,
+    protocol: Protocol,
+    proxy_timeout: int = 10,
+    session: aiohttp.ClientSession | None = None,
+) -> ProxyHttpResult | None:
+    """
+    Attempt to make an HTTP GET request through a given proxy.
+
+    This function supports both HTTP/HTTPS and SOCKS4/SOCKS5 proxies. It measures the
+    response time and optionally returns the response body for successful requests.
+
+    Args:
+        url (str): The target URL to perform a GET request on.
+        proxy_url (str): The proxy server URL in format protocol://ip:port.
+        protocol (Protocol): The protocol of the proxy (e.g., HTTP, SOCKS5).
+        proxy_timeout (int, optional): Timeout in seconds for proxy connection and response. Defaults to 10.
+        session (aiohttp.ClientSession | None, optional): An existing session created with
+            'create_proxy_session'. If omitted, a new session is created and closed after the request.
+            Call 'graceful_shutdown' once before closing the event loop.
+
+    Returns:
+        ProxyHttpResult | None: A ProxyHttpResult object if the request was successful, None otherwise.
+    """
     try:
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-            loop = asyncio.get_running_loop()
-            start_time = loop.time()
-            async with session.get(url=url, proxy=proxy) as resp:
-                duration = int((loop.time() - start_time) * 1_000)  # seconds to milliseconds
-                body = ""
-                if HTTP_STATUS_OK <= resp.status < HTTP_STATUS_MULTIPLE_CHOICES:
-                    body = await resp.text()
-
-                await graceful_shutdown(protocol)
-
-                return ProxyHttpResult(time=duration, status=resp.status, text=body)
-
-    except (
-        aiohttp.client_exceptions.ClientError,
-        aiohttp.client_exceptions.ClientConnectorCertificateError,
-        aiohttp.client_exceptions.ClientConnectorSSLError,
-    ):
-        pass
-    except (  # author of aiohttp_socks did not bother with proper exception wrapping
-        ProxyConnectionError,
-        ProxyError,
-        OSError,
-        asyncio.exceptions.IncompleteReadError,
-    ):
+        if session:
+            return await _request_with_proxy(session, url, proxy_url, protocol)
+
+        async with create_proxy_session(proxy_url, protocol, proxy_timeout) as own_session:
+            return await _request_with_proxy(own_session, url, proxy_url, protocol)
+    except PROXY_ERRORS:
         pass
     except Exception:  # noqa: BLE001
         logger.debug("Proxy check failed for %s", proxy_url, exc_info=True)
 
-    await graceful_shutdown(protocol)
     return None
 
 
-async def try_http_request(url: str) -> HttpResult | None:
+async def _request_with_proxy(
+    session: aiohttp.ClientSession,
+    url: str,
+    proxy_url: str,
+    protocol: Protocol,
+) -> ProxyHttpResult:
     """
-    Attempt a direct HTTP GET request and returns the result.
-
-    Automatically follows redirects up to a limit.
+    Perform a single HTTP GET request through a proxy using the given session.
 
     Args:
-        url (str): The target URL for the HTTP GET request.
+        session (aiohttp.ClientSession): The session bound to the proxy.
+        url (str): The target URL to perform a GET request on.
+        proxy_url (str): The proxy server URL in format protocol://ip:port.
+        protocol (Protocol): The protocol of the proxy (e.g., HTTP, SOCKS5).
 
     Returns:
-        HttpResult | None: Result containing status and text if successful; None otherwise.
+        ProxyHttpResult: The result of the request. Errors are propagated to the caller.
     """
-    try:
-        async with aiohttp.ClientSession() as session:
-            response = await session.get(url, allow_redirects=True, max_redirects=10)
-            body = ""
-            if HTTP_STATUS_OK <= response.status < HTTP_STATUS_MULTIPLE_CHOICES:
-                body = await response.text()
+    # socks proxies are handled by session connector
+    proxy = None if protocol in (Protocol.SOCKS4, Protocol.SOCKS5) else proxy_url
 
-            await graceful_shutdown()
+    start_time = time.perf_counter_ns()
+    async with session.get(url=url, proxy=proxy) as resp:
+        duration = (time.perf_counter_ns() - start_time) // 1_000_000  # nanoseconds to milliseconds
+        body = ""
+        if HTTP_STATUS_OK <= resp.status < HTTP_STATUS_MULTIPLE_CHOICES:
+            body = await resp.text()
 
-            return HttpResult(status=response.status, text=body)
-    except (aiohttp.client_exceptions.ClientError, ConnectionError) as exc:
-        logger.debug("Http request to '%s' failed", url, exc_info=exc)
+        return ProxyHttpResult(time=duration, status=resp.status, text=body)
 
-    return None
+
+async def http_request_lines(
+    url: str,
+    chunk_size: int = 64 * 1024,
+    session: aiohttp.ClientSession | None = None,
+) -> AsyncIterator[list[str]]:
+    """
+    Perform a direct HTTP GET request and stream the response body as batches of lines.
+
+    The body is read and decoded chunk by chunk, so the whole response is never buffered at once.
+    Automatically follows redirects up to a limit. Nothing is yielded if the response status is not 2xx.
+    Errors are raised even after some lines were yielded, so the caller can tell a truncated body
+    from a complete one.
+
+    Args:
+        url (str): The target URL for the HTTP GET request.
+        chunk_size (int, optional): Maximum size of a body chunk in bytes. Defaults to 64 KiB.
+        session (aiohttp.ClientSession | None, optional): An existing session to send the request with,
+            so that several downloads reuse pooled connections and the DNS cache. If omitted,
+            a new session is created and closed after the request.
+
+    Yields:
+        list[str]: Lines of the response body received so far, without line separators.
+
+    Raises:
+        aiohttp.ClientError: If the request fails or the body can not be received completely.
+        TimeoutError: If the request times out.
+        LookupError: If the response charset is unknown.
+    """
+    if session:
+        async for lines in _request_lines(session, url, chunk_size):
+            yield lines
+    else:
+        async with aiohttp.ClientSession() as own_session:
+            async for lines in _request_lines(own_session, url, chunk_size):
+                yield lines
+
+    await graceful_shutdown()
+
+
+async def _request_lines(session: aiohttp.ClientSession, url: str, chunk_size: int) -> AsyncIterator[list[str]]:
+    """
+    Perform a direct HTTP GET request using the given session and stream the body as batches of lines.
+
+    Args:
+        session (aiohttp.ClientSession): The session to send the request with.
+        url (str): The target URL for the HTTP GET request.
+        chunk_size (int): Maximum size of a body chunk in bytes.
+
+    Yields:
+        list[str]: Lines of the response body received so far, without line separators.
+            Errors are propagated to the caller.
+    """
+    async with session.get(url, allow_redirects=True, max_redirects=10) as response:
+        if not HTTP_STATUS_OK <= response.status < HTTP_STATUS_MULTIPLE_CHOICES:
+            logger.debug("Http request to '%s' failed with status code %i", url, response.status)
+            return
+
+        decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+        tail = ""
+        async for chunk in response.content.iter_chunked(chunk_size):
+            lines = (tail + decoder.decode(chunk)).split("\n")
+            tail = lines.pop()  # the last line may continue in the next chunk
+            if lines:
+                yield lines
+
+        tail += decoder.decode(b"", final=True)
+        if tail:
+            yield [tail]
@@ -1,118 +1,188 @@
+import hashlib
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import NamedTuple
 
-from fastapi import APIRouter, Request, status
+from fastapi import APIRouter, Request, Response, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from app.core.config import common_settings
 
 from .utils.user_deps import IsLoggedDep
 
-BASE_PATH = Path(__file__).resolve().parent.parent
+# module paths are already absolute, no need to resolve symlinks with an extra syscall
+BASE_PATH = Path(__file__).parent.parent
+TEMPLATES_PATH = str(BASE_PATH / "templates")
 
-templates = Jinja2Templates(directory=str(BASE_PATH / "templates"))
+templates_env = Environment(
+    loader=FileSystemLoader(TEMPLATES_PATH),
+    autoescape=True,
+    # check template files for changes on every render only while debugging
+    auto_reload=common_settings.debug,
+    # share compiled templates between uvicorn workers and restarts
+    bytecode_cache=FileSystemBytecodeCache(),
+)
 
-router = APIRouter()
+templates = Jinja2Templates(env=templates_env)
+
+# compile every page template once at import time so the first request of a fresh worker
+# does not pay for template parsing; rendering then only hits the environment's in-memory cache
+for template_name in templates_env.list_templates(extensions=["html"]):
+    templates_env.get_template(template_name)
+
+STATIC_PAGE_CACHE_CONTROL = "public, max-age=300"
+# pages behind login must be revalidated on every visit, so the login check still runs
+PRIVATE_PAGE_CACHE_CONTROL = "private, no-cache"
+STATIC_PAGE_CACHE_SIZE = 32
 
+# (template name, base url) -> (rendered body, etag)
+# static pages only depend on the base url through 'url_for', so they are rendered once per host
+_static_pages: dict[tuple[str, str], tuple[bytes, str]] = {}
 
-@router.get("/", status_code=status.HTTP_200_OK)
-async def index(request: Request) -> HTMLResponse:
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
     """
-    Render the index (home) page.
+    Check whether an If-None-Match header value matches an entity tag.
+
+    Uses the weak comparison required for If-None-Match (RFC 9110, section 13.1.2): the 'W/' prefix
+    is ignored, so entity tags that only differ in weakness match.
 
     Args:
-        request (Request): The incoming HTTP request object.
+        if_none_match (str): The If-None-Match header value, '*' or a comma-separated list of entity tags.
+        etag (str): The current entity tag of the resource.
 
     Returns:
-        HTMLResponse: Rendered HTML response using the index.html Jinja2 template.
+        bool: True if the header matches the entity tag, False otherwise.
     """
-    context = {"request": request}
-    return templates.TemplateResponse("index.html", context=context)
+    opaque_tag = etag.removeprefix("W/")
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag == "*" or tag.removeprefix("W/") == opaque_tag for tag in tags)
 
 
-@router.get("/api", status_code=status.HTTP_200_OK)
-async def api_docs(request: Request) -> HTMLResponse:
+def render_static_page(
+    request: Request,
+    name: str,
+    cache_control: str = STATIC_PAGE_CACHE_CONTROL,
+) -> Response:
     """
-    Render the index (home) page.
+    Render a page that does not depend on the request, with ETag based revalidation.
+
+    The rendered body is cached per base URL, so the template is not rendered on the event loop
+    again for later requests. If the client already has the current version of the page,
+    an empty 304 Not Modified response is returned instead.
 
     Args:
         request (Request): The incoming HTTP request object.
+        name (str): The name of the Jinja2 template to render.
+        cache_control (str, optional): The Cache-Control header value. Defaults to public caching.
 
     Returns:
-        HTMLResponse: Rendered HTML response using the index.html Jinja2 template.
+        Response: Rendered HTML response, or a 304 response if the client's copy is up to date.
     """
-    context = {"request": request}
-    return templates.TemplateResponse("api.html", context=context)
+    key = (name, str(request.base_url))
+    page = _static_pages.get(key)
+    if page is None:
+        body = templates.get_template(name).render({"request": request}).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        page = (body, etag)
 
+        # the base url comes from the Host header, do not let it grow the cache without bound
+        if len(_static_pages) >= STATIC_PAGE_CACHE_SIZE:
+            _static_pages.clear()
+        _static_pages[key] = page
 
-@router.get("/login", status_code=status.HTTP_200_OK)
-async def login(request: Request) -> HTMLResponse:
-    """
-    Render the login page.
+    body, etag = page
+    headers = {"ETag": etag, "Cache-Control": cache_control}
 
-    Args:
-        request (Request): The incoming HTTP request object.
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    Returns:
-        HTMLResponse: Rendered HTML response using the login.html Jinja2 template.
-    """
-    context = {"request": request}
-    return templates.TemplateResponse("login.html", context=context)
+    return HTMLResponse(body, headers=headers)
 
 
-@router.get("/dashboard", status_code=status.HTTP_200_OK, response_model=None)
-async def dashboard(request: Request, is_logged: IsLoggedDep) -> HTMLResponse | RedirectResponse:
+class Page(NamedTuple):
     """
-    Render the dashboard page if the user is logged in; otherwise, redirect to login.
+    Description of an HTML page served by the pages router.
 
-    Args:
-        request (Request): The incoming HTTP request.
-        is_logged (IsLoggedDep): Dependency that indicates if the user is authenticated.
-
-    Returns:
-        HTMLResponse: Rendered 'dashboard.html' template if logged in.
-        RedirectResponse: Redirect to login page if not authenticated.
+    Attributes:
+        path (str): The URL path of the page.
+        name (str): The route name, used by 'url_for' in templates.
+        template (str): The name of the Jinja2 template to render.
+        requires_login (bool): Whether anonymous users are redirected to the login page.
     """
-    if not is_logged:
-        return RedirectResponse(request.url_for("login"), status_code=status.HTTP_302_FOUND)
 
-    context = {"request": request}
-    return templates.TemplateResponse("dashboard.html", context=context)
+    path: str
+    name: str
+    template: str
+    requires_login: bool = False
+
+
+PAGES = (
+    Page("/", "index", "index.html"),
+    Page("/api", "api_docs", "api.html"),
+    Page("/login", "login", "login.html"),
+    Page("/dashboard", "dashboard", "dashboard.html", requires_login=True),
+    Page("/source", "source", "source.html", requires_login=True),
+    Page("/user", "user", "user.html", requires_login=True),
+)
+"""All HTML pages, registered on the router in this order."""
 
 
-@router.get("/source", status_code=status.HTTP_200_OK, response_model=None)
-async def source(request: Request, is_logged: IsLoggedDep) -> HTMLResponse | RedirectResponse:
+def redirect_to_login(request: Request) -> RedirectResponse:
     """
-    Render the source management page if the user is logged in; otherwise, redirect to login.
+    Build a redirect response to the login page.
 
     Args:
-        request (Request): The incoming HTTP request.
-        is_logged (IsLoggedDep): Dependency that indicates if the user is authenticated.
+        request (Request): The incoming HTTP request, used for its base URL.
 
     Returns:
-        HTMLResponse: Rendered 'source.html' template if logged in.
-        RedirectResponse: Redirect to login page if not authenticated.
+        RedirectResponse: Redirect to the login page.
     """
-    if not is_logged:
-        return RedirectResponse(request.url_for("login"), status_code=status.HTTP_302_FOUND)
+    return RedirectResponse(f"{request.base_url}{LOGIN_PATH}", status_code=status.HTTP_302_FOUND)
 
-    context = {"request": request}
-    return templates.TemplateResponse("source.html", context=context)
 
-
-@router.get("/user", status_code=status.HTTP_200_OK, response_model=None)
-async def user(request: Request, is_logged: IsLoggedDep) -> HTMLResponse | RedirectResponse:
+def make_page_handler(page: Page) -> Callable[..., Awaitable[Response]]:
     """
-    Render the user profile or settings page if the user is logged in; otherwise, redirect to login.
+    Create a route handler that renders the given page.
+
+    Public pages are cacheable by anyone. Pages that require login redirect anonymous
+    users to the login page and are only cacheable by the browser.
 
     Args:
-        request (Request): The incoming HTTP request.
-        is_logged (IsLoggedDep): Dependency that indicates if the user is authenticated.
+        page (Page): The page to create the handler for.
 
     Returns:
-        HTMLResponse: Rendered 'user.html' template if the user is authenticated.
-        RedirectResponse: Redirect to the login page if the user is not authenticated.
+        Callable[..., Awaitable[Response]]: The route handler.
     """
-    if not is_logged:
-        return RedirectResponse(request.url_for("login"), status_code=status.HTTP_302_FOUND)
+    if page.requires_login:
+
+        async def private_page(request: Request, is_logged: IsLoggedDep) -> Response:
+            if not is_logged:
+                return redirect_to_login(request)
+            return render_static_page(request, page.template, PRIVATE_PAGE_CACHE_CONTROL)
+
+        return private_page
+
+    async def public_page(request: Request) -> Response:
+        return render_static_page(request, page.template)
+
+    return public_page
+
+
+router = APIRouter()
 
-    context = {"request": request}
-    return templates.TemplateResponse("user.html", context=context)
+for page in PAGES:
+    router.add_api_route(
+        page.path,
+        make_page_handler(page),
+        methods=["GET"],
+        name=page.name,
+        status_code=status.HTTP_200_OK,
+        response_model=None,
+    )
+
+# the login route is static, so resolve its path once instead of matching the route table per redirect
+LOGIN_PATH = router.url_path_for("login").lstrip("/")
@@ -3,39 +3,42 @@ from uuid import UUID
 
 from fastapi import Depends, Request
 
-from app.core.database import async_session_factory
+from app.core.database import readonly_session_factory
 from app.core.exceptions import TokenError
+from app.core.login_cache import get_cached_user_id, remember_access_token
 from app.core.security import JWT
 from app.core.uow import SQLUnitOfWork
 from app.service.user import UserService
 
 
-def get_user_service() -> UserService:
+def get_readonly_user_service() -> UserService:
     """
-    Dependency function that provides an instance of UserService.
+    Dependency function that provides an instance of UserService for read-only lookups.
 
-    Creates a new SQLUnitOfWork using the async session factory
-    and returns a UserService that uses this UoW.
+    The unit of work runs on autocommit connections, so checking a user
+    does not open and commit a transaction around a single SELECT.
 
     Returns:
-        UserService: An instance of UserService with a unit of work.
+        UserService: An instance of UserService with a read-only unit of work.
     """
-    # TODO(sny): this function already exists in /api
-    uow = SQLUnitOfWork(async_session_factory)
+    uow = SQLUnitOfWork(readonly_session_factory)
     return UserService(uow)
 
 
-UserServiceDep = Annotated[UserService, Depends(get_user_service)]
-"""Dependency for providing an instance of UserService."""
+ReadonlyUserServiceDep = Annotated[UserService, Depends(get_readonly_user_service)]
+"""Dependency for providing an instance of UserService for read-only lookups."""
 
 
-async def is_logged_in(request: Request, user_service: UserServiceDep) -> bool:
+async def is_logged_in(request: Request, user_service: ReadonlyUserServiceDep) -> bool:
     """
     Check whether the current request has a valid logged-in user via cookie token.
 
+    Successful checks are cached per token for a short time, so repeated page loads
+    skip both the token signature verification and the database lookup.
+
     Args:
         request (Request): The current HTTP request, used to access cookies.
-        user_service (UserServiceDep): The user service for verifying the user by token.
+        user_service (ReadonlyUserServiceDep): The user service for verifying the user by token.
 
     Returns:
         bool: True if a valid access token exists and corresponds to a known user, False otherwise.
@@ -44,14 +47,20 @@ async def is_logged_in(request: Request, user_service: UserServiceDep) -> bool:
     if not access_token:
         return False
 
+    if get_cached_user_id(access_token) is not None:
+        return True
+
     try:
-        user_id = JWT.decode(access_token)
+        user_id, token_expiry = JWT.decode_with_expiry(access_token)
     except TokenError:
         return False
 
     user = await user_service.get_by_id(UUID(user_id))
-    if not user:  # noqa: SIM103
+    if not user:
         return False
+
+    remember_access_token(access_token, user.id, token_expiry)
+
     return True
 
 
@@ -3,7 +3,7 @@ from uuid import uuid4
 
 import pycountry
 import pytest_asyncio
-from sqlalchemy import insert
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -18,7 +18,11 @@ from app.models.country import Country
 
 @pytest_asyncio.fixture(loop_scope="session", scope="session")
 async def db_engine() -> AsyncGenerator[AsyncEngine]:
-    with PostgresContainer("postgres:17.4") as postgres_container:
+    # the database is thrown away after the run, so durability is traded for faster writes
+    postgres = PostgresContainer("postgres:17.4").with_command(
+        "postgres -c fsync=off -c synchronous_commit=off -c full_page_writes=off",
+    )
+    with postgres as postgres_container:
         engine = create_async_engine(
             postgres_container.get_connection_url(driver="asyncpg"),
         )
@@ -27,17 +31,16 @@ async def db_engine() -> AsyncGenerator[AsyncEngine]:
             await conn.run_sync(Base.metadata.create_all)
 
         async with engine.begin() as conn:
-            # insert countries into lookup table
-            for country in pycountry.countries:
-                stmt = insert(Country).values(
-                    {
-                        "id": uuid4(),
-                        "code": country.alpha_2,
-                        "name": country.name,
-                    }
-                )
-                await conn.execute(stmt)
-            await conn.commit()
+            # insert countries into lookup table in a single executemany round trip
+            countries = [
+                {
+                    "id": uuid4(),
+                    "code": country.alpha_2,
+                    "name": country.name,
+                }
+                for country in pycountry.countries
+            ]
+            await conn.execute(insert(Country), countries)
 
         yield engine
 
@@ -46,6 +49,26 @@ async def db_engine() -> AsyncGenerator[AsyncEngine]:
 
 
 @pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def countries_by_code(db_engine: AsyncEngine) -> dict[str, Country]:
+    # countries are seeded once per session and never change, so look them up once;
+    # the returned entities are detached and get attached to whichever session uses them
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        result = await session.execute(select(Country))
+        return {country.code: country for country in result.scalars().all()}
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="function")
 async def db_session_factory(db_engine: AsyncEngine) -> AsyncGenerator[async_sessionmaker[AsyncSession]]:
-    async_session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
-    yield async_session_factory
+    # every test runs inside one outer transaction on a single connection, which is rolled back afterwards;
+    # sessions join it through savepoints, so each unit of work commit only releases a savepoint
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+
+        async_session_factory = async_sessionmaker(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        yield async_session_factory
+
+        await transaction.rollback()
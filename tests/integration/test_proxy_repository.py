@@ -1,5 +1,5 @@
 import random
-from ipaddress import IPv4Address, IPv6Address, ip_address
+from ipaddress import IPv4Address
 from uuid import uuid4
 
 import pytest
@@ -7,38 +7,38 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.exceptions import LogicError
 from app.core.uow import SQLUnitOfWork
+from app.models.country import Country
 from app.models.proxy import Protocol, Proxy, ProxyAddress, ProxyHealth
 
 
-def random_ipv4() -> IPv4Address | IPv6Address:
-    ip = ".".join(map(str, (random.randint(0, 255) for _ in range(4))))
-    return ip_address(ip)
+def random_ipv4() -> IPv4Address:
+    return IPv4Address(random.getrandbits(32))
 
 
 def make_proxy(protocol_ = Protocol.SOCKS4) -> Proxy:
-    proxy = Proxy()
-    proxy.id = uuid4()
-    proxy.address = random_ipv4()
-    proxy.port = 8080
-    proxy.protocol = protocol_
-    proxy.geo_address = None
-
-    proxy.health = ProxyHealth()
-    proxy.health.id = uuid4()
-    proxy.health.total_conn_attempts = 4
-    proxy.health.failed_conn_attempts = 0
-    proxy.health.latency = 0
-    proxy.health.last_tested = None
-    proxy.health.proxy_id = proxy.id
-
-    return proxy
+    proxy_id = uuid4()
+    return Proxy(
+        id=proxy_id,
+        address=random_ipv4(),
+        port=8080,
+        protocol=protocol_,
+        geo_address=None,
+        health=ProxyHealth(
+            id=uuid4(),
+            total_conn_attempts=4,
+            failed_conn_attempts=0,
+            latency=0,
+            last_tested=None,
+            proxy_id=proxy_id,
+        ),
+    )
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
 async def test_proxy_repository_add(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    proxy = make_proxy()
     async with SQLUnitOfWork(db_session_factory) as uow:
-        proxy = make_proxy()
         await uow.proxy_repository.add(proxy)
 
     async with SQLUnitOfWork(db_session_factory) as uow:
@@ -50,8 +50,8 @@ async def test_proxy_repository_add(db_session_factory: async_sessionmaker[Async
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
 async def test_proxy_repository_update(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    proxy = make_proxy()
     async with SQLUnitOfWork(db_session_factory) as uow:
-        proxy = make_proxy()
         await uow.proxy_repository.add(proxy)
 
     async with SQLUnitOfWork(db_session_factory) as uow:
@@ -72,8 +72,8 @@ async def test_proxy_repository_update(db_session_factory: async_sessionmaker[As
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
 async def test_proxy_repository_remove(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    proxy = make_proxy()
     async with SQLUnitOfWork(db_session_factory) as uow:
-        proxy = make_proxy()
         await uow.proxy_repository.add(proxy)
 
     async with SQLUnitOfWork(db_session_factory) as uow:
@@ -88,16 +88,18 @@ async def test_proxy_repository_remove(db_session_factory: async_sessionmaker[As
 
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
-async def test_proxy_repository_geo_address_add(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
-    async with SQLUnitOfWork(db_session_factory) as uow:
-        geo_address = ProxyAddress()
-        geo_address.id = uuid4()
-        geo_address.city = "Chicago"
-        geo_address.region = "Illinois"
-        geo_address.country = await uow.proxy_repository.get_country_by_code("US")
-        assert geo_address.country
-        geo_address.country_id = geo_address.country.id
+async def test_proxy_repository_geo_address_add(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    countries_by_code: dict[str, Country],
+) -> None:
+    geo_address = ProxyAddress()
+    geo_address.id = uuid4()
+    geo_address.city = "Chicago"
+    geo_address.region = "Illinois"
+    geo_address.country = countries_by_code["US"]
+    geo_address.country_id = geo_address.country.id
 
+    async with SQLUnitOfWork(db_session_factory) as uow:
         stored_geo_address = await uow.proxy_repository.add_geo_address(geo_address)
         assert stored_geo_address
         assert stored_geo_address.country == geo_address.country
@@ -117,25 +119,25 @@ async def test_proxy_repository_geo_address_add(db_session_factory: async_sessio
 
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
-async def test_proxy_repository_geo_address_proxy(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+async def test_proxy_repository_geo_address_proxy(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    countries_by_code: dict[str, Country],
+) -> None:
     proxy = make_proxy(Protocol.SOCKS4)
     proxy.health.total_conn_attempts = 4
     proxy.health.failed_conn_attempts = 0
 
-    async with SQLUnitOfWork(db_session_factory) as uow:
-        geo_address = ProxyAddress()
-        geo_address.id = uuid4()
-        geo_address.city = "Detroit"
-        geo_address.country = await uow.proxy_repository.get_country_by_code("US")
-        geo_address.region = "Michigan"
-        assert geo_address.country
-        geo_address.country_id = geo_address.country.id
+    geo_address = ProxyAddress()
+    geo_address.id = uuid4()
+    geo_address.city = "Detroit"
+    geo_address.country = countries_by_code["US"]
+    geo_address.region = "Michigan"
+    geo_address.country_id = geo_address.country.id
 
     async with SQLUnitOfWork(db_session_factory) as uow:
         assert await uow.proxy_repository.add(proxy)
         assert await uow.proxy_repository.add_geo_address(geo_address)
 
-    async with SQLUnitOfWork(db_session_factory) as uow:
         stored_proxy = await uow.proxy_repository.get_by_id(proxy.id)
         stored_geo_address = await uow.proxy_repository.get_geo_address_by_id(geo_address.id)
         assert stored_proxy
@@ -173,11 +175,13 @@ async def test_proxy_repository_get_geo_address_by_location(
 @pytest.mark.asyncio(loop_scope="session")
 async def test_proxy_repository_get_proxies(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
     async with SQLUnitOfWork(db_session_factory) as uow:
+        countries = await uow.proxy_repository.get_countries_by_codes(["NL", "FR"])
+
         proxy = make_proxy(Protocol.HTTPS)
         geo_address = ProxyAddress()
         geo_address.id = uuid4()
         geo_address.city = "Amsterdam"
-        geo_address.country = await uow.proxy_repository.get_country_by_code("NL")
+        geo_address.country = countries.get("NL")
         geo_address.region = "North Holland"
         assert geo_address.country
         geo_address.country_code = geo_address.country.id
@@ -189,7 +193,7 @@ async def test_proxy_repository_get_proxies(db_session_factory: async_sessionmak
         geo_address = ProxyAddress()
         geo_address.id = uuid4()
         geo_address.city = "Utrecht"
-        geo_address.country = await uow.proxy_repository.get_country_by_code("NL")
+        geo_address.country = countries.get("NL")
         geo_address.region = "Utrecht"
         assert geo_address.country
         geo_address.country_code = geo_address.country.id
@@ -201,7 +205,7 @@ async def test_proxy_repository_get_proxies(db_session_factory: async_sessionmak
         geo_address = ProxyAddress()
         geo_address.id = uuid4()
         geo_address.city = "Lyon"
-        geo_address.country = await uow.proxy_repository.get_country_by_code("FR")
+        geo_address.country = countries.get("FR")
         geo_address.region = "Auvergne-Rhone-Alpes"
         assert geo_address.country
         geo_address.country_code = geo_address.country.id
@@ -251,8 +255,8 @@ async def test_proxy_repository_get_proxies(db_session_factory: async_sessionmak
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
 async def test_proxy_repository_add_bulk(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    proxies = [make_proxy() for _ in range(3)]
     async with SQLUnitOfWork(db_session_factory) as uow:
-        proxies = [make_proxy() for _ in range(3)]
         await uow.proxy_repository.add_bulk(proxies)
 
 @pytest.mark.integration
@@ -266,8 +270,8 @@ async def test_proxy_repository_add_bulk_zero_proxies(db_session_factory: async_
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
 async def test_proxy_repository_update_bulk(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    proxies = [make_proxy() for _ in range(3)]
     async with SQLUnitOfWork(db_session_factory) as uow:
-        proxies = [make_proxy() for _ in range(3)]
         await uow.proxy_repository.add_bulk(proxies)
 
         for proxy in proxies:
@@ -292,18 +296,31 @@ async def test_proxy_repository_get_country_by_code(db_session_factory: async_se
 
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
-async def test_proxy_repository_proxies_count(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+async def test_proxy_repository_get_countries_by_codes(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
     async with SQLUnitOfWork(db_session_factory) as uow:
-        proxy = make_proxy(Protocol.HTTPS)
-        geo_address = ProxyAddress()
-        geo_address.id = uuid4()
-        geo_address.city = "Dallas"
-        geo_address.country = await uow.proxy_repository.get_country_by_code("US")
-        geo_address.region = "Texas"
-        assert geo_address.country
-        geo_address.country_code = geo_address.country.id
-        proxy.geo_address = geo_address
+        countries = await uow.proxy_repository.get_countries_by_codes(["US", "NL", "XX"])
+        assert set(countries) == {"US", "NL"}
+        assert countries["US"].name == "United States"
 
+        assert await uow.proxy_repository.get_countries_by_codes([]) == {}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_proxy_repository_proxies_count(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    countries_by_code: dict[str, Country],
+) -> None:
+    proxy = make_proxy(Protocol.HTTPS)
+    geo_address = ProxyAddress()
+    geo_address.id = uuid4()
+    geo_address.city = "Dallas"
+    geo_address.country = countries_by_code["US"]
+    geo_address.region = "Texas"
+    geo_address.country_code = geo_address.country.id
+    proxy.geo_address = geo_address
+
+    async with SQLUnitOfWork(db_session_factory) as uow:
         await uow.proxy_repository.add(proxy)
 
     async with SQLUnitOfWork(db_session_factory) as uow:
@@ -315,9 +332,8 @@ async def test_proxy_repository_proxies_count(db_session_factory: async_sessionm
 @pytest.mark.asyncio(loop_scope="session")
 async def test_proxy_repository_get_countries(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
     async with SQLUnitOfWork(db_session_factory) as uow:
-        de = await uow.proxy_repository.get_country_by_code("DE")
-        us = await uow.proxy_repository.get_country_by_code("US")
-        fr = await uow.proxy_repository.get_country_by_code("FR")
+        countries = await uow.proxy_repository.get_countries_by_codes(["DE", "US", "FR"])
+        de, us, fr = countries["DE"], countries["US"], countries["FR"]
 
         address1 = ProxyAddress(id=uuid4(), country_id=de.id, region="Bavaria", city="Munich")
         address2 = ProxyAddress(id=uuid4(), country_id=us.id, region="California", city="LA")
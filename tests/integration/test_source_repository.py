@@ -1,4 +1,5 @@
 import random
+from ipaddress import IPv4Address
 from uuid import uuid4
 
 import pytest
@@ -9,35 +10,36 @@ from app.models.source import Source, SourceHealth, SourceType
 
 
 def make_a_source() -> Source:
-    name = "".join(map(str, (random.randint(ord("a"), ord("z")) for _ in range(4))))
-    ip = ".".join(map(str, (random.randint(0, 255) for _ in range(4))))
-
-    source = Source()
-    source.id = uuid4()
-    source.name = name
-    source.uri = f"http://{ip}:8080/text.txt"
-    source.uri_predefined_type = None
-    source.type = SourceType.Text
-
-    source.health = SourceHealth()
-    source.health.id = uuid4()
-    source.health.total_conn_attempts = 0
-    source.health.failed_conn_attempts = 0
-
-    return source
+    name = random.randbytes(2).hex()
+    ip = IPv4Address(random.getrandbits(32))
+
+    return Source(
+        id=uuid4(),
+        name=name,
+        uri=f"http://{ip}:8080/text.txt",
+        uri_predefined_type=None,
+        type=SourceType.Text,
+        health=SourceHealth(
+            id=uuid4(),
+            total_conn_attempts=0,
+            failed_conn_attempts=0,
+        ),
+    )
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
 async def test_source_repository_add(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    source = make_a_source()
     async with SQLUnitOfWork(db_session_factory) as uow:
-        source = make_a_source()
-        assert await uow.source_repository.add(source)
+        await uow.source_repository.add(source)
 
     async with SQLUnitOfWork(db_session_factory) as uow:
         stored_source = await uow.source_repository.get_by_id(source.id)
         assert stored_source
         assert stored_source.name == source.name
+        assert stored_source.uri == source.uri
+        assert stored_source.health.total_conn_attempts == 0
 
     async with SQLUnitOfWork(db_session_factory) as uow:
         stored_source = await uow.source_repository.get_by_name(source.name)
@@ -63,6 +65,29 @@ async def test_source_repository_update(db_session_factory: async_sessionmaker[A
         assert stored_source.health.total_conn_attempts == 100
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_source_repository_update_bulk(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    async with SQLUnitOfWork(db_session_factory) as uow:
+        sources = [make_a_source() for _ in range(3)]
+        for source in sources:
+            await uow.source_repository.add(source)
+
+    for source in sources:
+        source.health.total_conn_attempts += 1
+        source.health.failed_conn_attempts += 1
+
+    async with SQLUnitOfWork(db_session_factory) as uow:
+        await uow.source_repository.update_bulk(sources, only_health=True)
+
+    async with SQLUnitOfWork(db_session_factory) as uow:
+        for source in sources:
+            stored_source = await uow.source_repository.get_by_id(source.id)
+            assert stored_source
+            assert stored_source.health.total_conn_attempts == 1
+            assert stored_source.health.failed_conn_attempts == 1
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
 async def test_source_repository_remove(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
@@ -83,12 +108,9 @@ async def test_source_repository_remove(db_session_factory: async_sessionmaker[A
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
 async def test_source_repository_get_sources(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
-    sources = []
+    sources = [make_a_source() for _ in range(3)]
     async with SQLUnitOfWork(db_session_factory) as uow:
-        for _ in range(3):
-            source = make_a_source()
-            source = await uow.source_repository.add(source)
-            sources.append(source)
+        await uow.source_repository.add_bulk(sources)
 
     async with SQLUnitOfWork(db_session_factory) as uow:
         result_sources = await uow.source_repository.get_sources()
@@ -2,7 +2,6 @@ from ipaddress import ip_address
 from uuid import uuid4
 
 import pytest
-import pytest_asyncio
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -12,6 +11,8 @@ from app.models.proxy import Protocol, Proxy
 from app.repository.proxy import ProxyRepository
 from app.repository.source import SourceRepository
 
+PROXY_ADDRESS = ip_address("127.0.1.1")
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
@@ -45,7 +46,7 @@ async def test_uow_commit_rollback(db_session_factory: async_sessionmaker[AsyncS
     async with SQLUnitOfWork(db_session_factory) as uow:
         proxy = Proxy()
         proxy.id = id_
-        proxy.address = ip_address("127.0.1.1")
+        proxy.address = PROXY_ADDRESS
         proxy.port = 8080
         proxy.protocol = Protocol.SOCKS4
 
@@ -58,7 +59,7 @@ async def test_uow_commit_rollback(db_session_factory: async_sessionmaker[AsyncS
         async with SQLUnitOfWork(db_session_factory) as uow:
             proxy = Proxy()
             proxy.id = id_
-            proxy.address = ip_address("127.0.1.1")
+            proxy.address = PROXY_ADDRESS
             proxy.port = 8080
             proxy.protocol = Protocol.SOCKS4
 
@@ -1,11 +1,10 @@
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.uow import SQLUnitOfWork
 from app.models.user import User
-from app.repository.user import UserRepository
 
 
 @pytest.mark.integration
@@ -0,0 +1,25 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from argon2 import PasswordHasher as Argon2Hasher
+
+from app.core.security import PasswordHasher
+from app.core.uow import SQLUnitOfWork
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cheap_argon2():
+    # unit tests check the wrapping, not the strength of the hash, so use the cheapest argon2 parameters
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(PasswordHasher, "_hasher", Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1))
+        yield
+
+
+@pytest.fixture
+def mock_uow() -> AsyncMock:
+    uow = AsyncMock(SQLUnitOfWork)
+    uow.__aenter__.return_value = uow
+    uow.proxy_repository = AsyncMock()
+    uow.source_repository = AsyncMock()
+    uow.user_repository = AsyncMock()
+    return uow
@@ -1,57 +1,63 @@
+import asyncio
 import datetime
+from array import array
 from ipaddress import IPv4Address, IPv6Address
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import aiohttp
 import pytest
 
-from app.models.proxy import Protocol
+from app.core.exceptions import NotFoundError
+from app.models.proxy import Location, Protocol
 from app.models.source import Source, SourceHealth
 from app.service.source import SourceService
 from app.tasks.fetch_proxies import (
+    ProxyBatch,
     check_list_of_proxies,
     check_proxy,
     download_proxy_list,
     fetch_all_proxy_lists,
+    fetch_proxies,
+    is_global_address,
+    parse_proxy_list,
+    store_checked_proxies,
     try_parse_ip_port,
     validate_port,
 )
-from app.tasks.utils.network_request import HttpResult
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 @pytest.mark.parametrize("port", [1, 65535])
-async def test_validate_port_valid(port):
+def test_validate_port_valid(port):
     validate_port(port)  # Should not raise
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 @pytest.mark.parametrize("port", [0, 65536])
-async def test_validate_port_invalid(port):
+def test_validate_port_invalid(port):
     with pytest.raises(ValueError):
         validate_port(port)
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("input_str", "expected"),
     [
         ("127.0.0.1:8080", (IPv4Address("127.0.0.1"), 8080)),
         ("http://192.168.1.1:3128", (IPv4Address("192.168.1.1"), 3128)),
         ("https://8.8.8.8:443", (IPv4Address("8.8.8.8"), 443)),
+        ("socks5://0.0.0.0:1080\r", (IPv4Address("0.0.0.0"), 1080)),
+        ("255.255.255.255:65535", (IPv4Address("255.255.255.255"), 65535)),
         ("10.0.0.1:0", None),  # invalid port
         ("10.0.0.1:65536", None),  # invalid port
     ],
 )
-async def test_valid_and_invalid_ip_port(input_str, expected):
+def test_valid_and_invalid_ip_port(input_str, expected):
     result = try_parse_ip_port(input_str)
     assert result == expected
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "invalid_input",
     [
@@ -63,40 +69,122 @@ async def test_valid_and_invalid_ip_port(input_str, expected):
         "example.com:80",
         "2001:db8::1:1080",
         "socks5://2001:db8::2:3128",
+        "256.1.1.1:8080",
+        "01.2.3.4:8080",
+        "1.2.3:8080",
+        "1.2.3.4:123456",
     ],
 )
-async def test_invalid_inputs(invalid_input):
+def test_invalid_inputs(invalid_input):
     assert try_parse_ip_port(invalid_input) is None
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    [
+        (IPv4Address("8.8.8.8"), True),
+        (IPv4Address("0.0.0.0"), False),
+        (IPv4Address("1.0.0.0"), True),
+        (IPv4Address("9.255.255.255"), True),
+        (IPv4Address("10.0.0.1"), False),
+        (IPv4Address("10.255.255.255"), False),
+        (IPv4Address("11.0.0.0"), True),
+        (IPv4Address("100.64.0.1"), False),
+        (IPv4Address("100.128.0.0"), True),
+        (IPv4Address("172.31.255.255"), False),
+        (IPv4Address("172.32.0.0"), True),
+        (IPv4Address("192.0.0.8"), False),
+        (IPv4Address("192.0.0.9"), True),
+        (IPv4Address("192.0.0.10"), True),
+        (IPv4Address("192.0.0.11"), False),
+        (IPv4Address("239.255.255.255"), True),
+        (IPv4Address("240.0.0.0"), False),
+        (IPv4Address("255.255.255.255"), False),
+        (IPv6Address("2001:4860:4860::8888"), True),
+        (IPv6Address("::1"), False),
+    ],
+)
+def test_is_global_address(address, expected):
+    assert is_global_address(address) is expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("address", [IPv4Address("192.0.0.8"), IPv4Address("192.0.0.255")])
+def test_is_global_address_ietf_protocol_assignments(address):
+    # 192.0.0.0/24 is not global in the IANA registry, even where 'is_global' (CPython < 3.12.4) disagrees
+    assert not is_global_address(address)
+
+
+@pytest.mark.unit
+def test_parse_proxy_list():
+    lines = ["8.8.8.8:8080\r", "socks5://1.1.1.1:1080", "", "invalid", "10.0.0.1:80"]
+    result = parse_proxy_list(lines, Protocol.SOCKS5)
+    assert list(result) == [
+        (IPv4Address("8.8.8.8"), 8080, Protocol.SOCKS5),
+        (IPv4Address("1.1.1.1"), 1080, Protocol.SOCKS5),
+    ]
+
+
+@pytest.mark.unit
+def test_proxy_batch():
+    batch = ProxyBatch()
+    batch.append(IPv4Address("1.1.1.1"), 80, Protocol.HTTP)
+    batch.append(IPv4Address("2.2.2.2"), 65535, Protocol.SOCKS4)
+
+    other = ProxyBatch()
+    other.append(IPv4Address("3.3.3.3"), 1080, Protocol.SOCKS5)
+    batch.extend(other)
+
+    assert len(batch) == 3
+    assert batch.ports.typecode == "H"
+    assert list(batch[1:]) == [
+        (IPv4Address("2.2.2.2"), 65535, Protocol.SOCKS4),
+        (IPv4Address("3.3.3.3"), 1080, Protocol.SOCKS5),
+    ]
+    assert not ProxyBatch()
+
+
+def fake_http_lines(*batches):
+    async def http_lines(url, **kwargs):
+        for lines in batches:
+            yield lines
+
+    return http_lines
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
-@patch("app.tasks.fetch_proxies.try_http_request")
-async def test_download_proxy_list_success(mock_http_request):
-    mock_http_request.return_value = AsyncMock(status=200, text="8.8.8.8:8080\ninvalid\n127.0.0.1:80")
+@patch("app.tasks.fetch_proxies.http_request_lines")
+async def test_download_proxy_list_success(mock_http_request_lines):
+    mock_http_request_lines.side_effect = fake_http_lines(["8.8.8.8:8080", "invalid"], ["127.0.0.1:80", "1.1.1.1:80"])
     result = await download_proxy_list("http://example.com", Protocol.HTTP)
-    assert result is not None
-    assert len(result) == 1
+    assert len(result) == 2
     assert (IPv4Address("8.8.8.8"), 8080, Protocol.HTTP) in result
+    assert (IPv4Address("1.1.1.1"), 80, Protocol.HTTP) in result
     # 127.0.0.1 is not global; invalid is ignored
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-@patch("app.tasks.fetch_proxies.try_http_request")
-async def test_download_proxy_list_get_http_failure(mock_http_request):
-    mock_http_request.return_value = None
+@patch("app.tasks.fetch_proxies.http_request_lines")
+async def test_download_proxy_list_get_http_failure(mock_http_request_lines):
+    mock_http_request_lines.side_effect = fake_http_lines()
     result = await download_proxy_list("http://bad-url.com", Protocol.HTTP)
-    assert result is None
+    assert not result
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-@patch("app.tasks.fetch_proxies.try_http_request")
-async def test_download_proxy_list_get_http_status_failure(mock_http_request):
-    mock_http_request.return_value = HttpResult(status=500, text="")
-    result = await download_proxy_list("http://bad-url.com", Protocol.HTTP)
-    assert result is None
+@patch("app.tasks.fetch_proxies.http_request_lines")
+async def test_download_proxy_list_drops_partial_list(mock_http_request_lines):
+    async def http_lines(url, **kwargs):
+        yield ["8.8.8.8:8080"]
+        raise aiohttp.ClientPayloadError
+
+    mock_http_request_lines.side_effect = http_lines
+    result = await download_proxy_list("http://example.com", Protocol.HTTP)
+    assert not result
 
 
 @pytest.mark.unit
@@ -126,9 +214,9 @@ async def test_check_proxy_invalid(mock_check):
 @pytest.mark.unit
 @pytest.mark.asyncio
 @patch("app.tasks.fetch_proxies.download_proxy_list", new_callable=AsyncMock)
-@patch("app.service.source.SourceService.update", new_callable=AsyncMock)
+@patch("app.service.source.SourceService.update_bulk", new_callable=AsyncMock)
 async def test_fetch_all_proxy_lists_updates_source_health(mock_update, mock_download_proxy_list):
-    mock_download_proxy_list.return_value = [(IPv4Address("8.8.8.8"), 8080, Protocol.HTTP)]
+    mock_download_proxy_list.return_value = ProxyBatch([IPv4Address("8.8.8.8")], array("H", [8080]), [Protocol.HTTP])
 
     source = Source(
         id=1,
@@ -140,19 +228,19 @@ async def test_fetch_all_proxy_lists_updates_source_health(mock_update, mock_dow
     source_service = SourceService(uow=AsyncMock())
     proxies = await fetch_all_proxy_lists([source], source_service)
 
-    assert proxies == [(IPv4Address("8.8.8.8"), 8080, Protocol.HTTP)]
+    assert list(proxies) == [(IPv4Address("8.8.8.8"), 8080, Protocol.HTTP)]
     assert source.health.total_conn_attempts == 1
     assert source.health.failed_conn_attempts == 0
     assert source.health.last_used is not None
-    mock_update.assert_called_once_with(source)
+    mock_update.assert_called_once_with([source], only_health=True)
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 @patch("app.tasks.fetch_proxies.download_proxy_list", new_callable=AsyncMock)
-@patch("app.service.source.SourceService.update", new_callable=AsyncMock)
+@patch("app.service.source.SourceService.update_bulk", new_callable=AsyncMock)
 async def test_fetch_all_proxy_lists_failed_download_increments_failure(mock_update, mock_download_proxy_list):
-    mock_download_proxy_list.return_value = None
+    mock_download_proxy_list.return_value = ProxyBatch()
 
     source = Source(
         id=1,
@@ -164,11 +252,44 @@ async def test_fetch_all_proxy_lists_failed_download_increments_failure(mock_upd
     source_service = SourceService(uow=AsyncMock())
     proxies = await fetch_all_proxy_lists([source], source_service)
 
-    assert proxies == []
+    assert len(proxies) == 0
     assert source.health.total_conn_attempts == 1
     assert source.health.failed_conn_attempts == 1
     assert source.health.last_used is not None
-    mock_update.assert_called_once_with(source)
+    mock_update.assert_called_once_with([source], only_health=True)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("app.tasks.fetch_proxies.download_proxy_list", new_callable=AsyncMock)
+@patch("app.service.source.SourceService.update_bulk", new_callable=AsyncMock)
+async def test_fetch_all_proxy_lists_deduplicates_proxies(mock_update, mock_download_proxy_list):
+    mock_download_proxy_list.side_effect = [
+        ProxyBatch([IPv4Address("8.8.8.8"), IPv4Address("1.1.1.1")], array("H", [8080, 80]), [Protocol.HTTP] * 2),
+        ProxyBatch(
+            [IPv4Address("8.8.8.8"), IPv4Address("8.8.8.8")],
+            array("H", [8080, 8080]),
+            [Protocol.HTTP, Protocol.SOCKS5],
+        ),
+    ]
+
+    sources = [
+        Source(
+            id=i,
+            uri=f"http://example.com/{i}",
+            uri_predefined_type=Protocol.HTTP,
+            health=SourceHealth(id=i, total_conn_attempts=0, failed_conn_attempts=0, last_used=None),
+        )
+        for i in range(2)
+    ]
+
+    proxies = await fetch_all_proxy_lists(sources, SourceService(uow=AsyncMock()))
+
+    assert list(proxies) == [
+        (IPv4Address("8.8.8.8"), 8080, Protocol.HTTP),
+        (IPv4Address("1.1.1.1"), 80, Protocol.HTTP),
+        (IPv4Address("8.8.8.8"), 8080, Protocol.SOCKS5),
+    ]
 
 
 @pytest.mark.unit
@@ -176,7 +297,118 @@ async def test_fetch_all_proxy_lists_failed_download_increments_failure(mock_upd
 @patch("app.tasks.fetch_proxies.check_proxy", new_callable=AsyncMock)
 async def test_check_list_of_proxies(mock_check_proxy):
     mock_check_proxy.side_effect = lambda ip, proto: (ip[0], ip[1], proto, 100, datetime.datetime.now(datetime.UTC))
-    input_proxies = [(IPv4Address("1.1.1.1"), 8080, Protocol.HTTP)]
+    input_proxies = ProxyBatch()
+    input_proxies.append(IPv4Address("1.1.1.1"), 8080, Protocol.HTTP)
     result = await check_list_of_proxies(input_proxies)
     assert len(result) == 1
     assert result[0][0] == IPv4Address("1.1.1.1")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("app.tasks.fetch_proxies.check_list_of_proxies", new_callable=AsyncMock)
+async def test_store_checked_proxies(mock_check_list):
+    tested = datetime.datetime.now(datetime.UTC)
+    mock_check_list.return_value = [
+        (IPv4Address("1.1.1.1"), 8080, Protocol.HTTP, 100, tested),
+        (IPv4Address("2.2.2.2"), 1080, Protocol.SOCKS5, 200, tested),
+    ]
+    location = Location(city="City", region="Region", country_code="US")
+    geoip_service = Mock()
+    geoip_service.get_geolocation.side_effect = [location, None]
+    proxy_service = AsyncMock()
+
+    await store_checked_proxies(ProxyBatch(), proxy_service, geoip_service, asyncio.Lock())
+
+    proxy_service.create_bulk.assert_awaited_once()
+    proxies_data = proxy_service.create_bulk.call_args.args[0]
+    assert len(proxies_data) == 1
+    assert proxies_data[0]["address"] == IPv4Address("1.1.1.1")
+    assert proxies_data[0]["location"] == location
+    assert proxies_data[0]["initial_health"].latency == 100
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("app.tasks.fetch_proxies.check_list_of_proxies", new_callable=AsyncMock)
+async def test_store_checked_proxies_nothing_checked(mock_check_list):
+    mock_check_list.return_value = []
+    proxy_service = AsyncMock()
+
+    await store_checked_proxies(ProxyBatch(), proxy_service, Mock(), asyncio.Lock())
+
+    proxy_service.create_bulk.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("app.tasks.fetch_proxies.check_list_of_proxies", new_callable=AsyncMock)
+async def test_store_checked_proxies_logs_store_failure(mock_check_list, caplog):
+    tested = datetime.datetime.now(datetime.UTC)
+    mock_check_list.return_value = [(IPv4Address("1.1.1.1"), 8080, Protocol.HTTP, 100, tested)]
+    geoip_service = Mock()
+    geoip_service.get_geolocation.return_value = Location(city="City", region="Region", country_code="XX")
+    proxy_service = AsyncMock()
+    proxy_service.create_bulk.side_effect = NotFoundError("Could not find country with code XX")
+
+    await store_checked_proxies(ProxyBatch(), proxy_service, geoip_service, asyncio.Lock())
+
+    assert "Failed to store 1 checked proxies" in caplog.text
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("app.tasks.fetch_proxies.graceful_shutdown", new_callable=AsyncMock)
+@patch("app.tasks.fetch_proxies.GeoIP")
+@patch("app.tasks.fetch_proxies.ProxyService")
+@patch("app.tasks.fetch_proxies.check_list_of_proxies", new_callable=AsyncMock)
+@patch("app.tasks.fetch_proxies.fetch_all_proxy_lists", new_callable=AsyncMock)
+@patch.object(SourceService, "get_sources", new_callable=AsyncMock)
+@patch("app.tasks.fetch_proxies.create_session_factory")
+async def test_fetch_proxies_checks_chunks_concurrently_and_stores_one_at_a_time(
+    mock_session_factory,
+    mock_get_sources,
+    mock_fetch_all,
+    mock_check_list,
+    mock_proxy_service,
+    mock_geoip,
+    mock_shutdown,
+):
+    mock_get_sources.return_value = [Mock()]
+    mock_fetch_all.return_value = ProxyBatch(
+        [IPv4Address(f"1.1.{i // 256}.{i % 256}") for i in range(1200)],
+        array("H", [8080] * 1200),
+        [Protocol.HTTP] * 1200,
+    )
+    mock_geoip.return_value.get_geolocation.return_value = Location(city="City", region="Region", country_code="US")
+
+    checking = 0
+    max_checking = 0
+    storing = 0
+    max_storing = 0
+
+    async def check_list(proxies):
+        nonlocal checking, max_checking
+        checking += 1
+        max_checking = max(max_checking, checking)
+        await asyncio.sleep(0.01)
+        checking -= 1
+        return [(IPv4Address("8.8.8.8"), 8080, Protocol.HTTP, 100, datetime.datetime.now(datetime.UTC))]
+
+    async def create_bulk(proxies_data):
+        nonlocal storing, max_storing
+        storing += 1
+        max_storing = max(max_storing, storing)
+        await asyncio.sleep(0.01)
+        storing -= 1
+
+    mock_check_list.side_effect = check_list
+    mock_proxy_service.return_value.create_bulk = AsyncMock(side_effect=create_bulk)
+
+    await fetch_proxies()
+
+    assert mock_check_list.await_count == 3
+    assert max_checking == 3
+    assert mock_proxy_service.return_value.create_bulk.await_count == 3
+    assert max_storing == 1
+    mock_shutdown.assert_awaited_once()
@@ -1,4 +1,5 @@
 import asyncio
+import inspect
 
 import pytest
 
@@ -34,6 +35,21 @@ async def test_cgather_filters_none_and_exceptions():
     assert sorted(result) == [1, 2, 3]
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cgather_keeps_argument_order():
+    async def return_after(val, delay):
+        await asyncio.sleep(delay)
+        return val
+
+    # later tasks finish first
+    tasks = [return_after(i, 0.01 * (5 - i)) for i in range(5)]
+
+    result = await cgather(*tasks, limit=5)
+
+    assert result == [0, 1, 2, 3, 4]
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_cgather_respects_concurrency_limit():
@@ -54,3 +70,62 @@ async def test_cgather_respects_concurrency_limit():
 
     assert sorted(result) == list(range(10))
     assert max_running <= 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cgather_no_tasks():
+    assert await cgather(limit=3) == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cgather_spawns_only_limit_workers():
+    max_tasks = 0
+
+    async def task(val):
+        nonlocal max_tasks
+        max_tasks = max(max_tasks, len(asyncio.all_tasks()))
+        await asyncio.sleep(0)
+        return val
+
+    tasks = [task(i) for i in range(20)]
+
+    result = await cgather(*tasks, limit=4)
+
+    assert sorted(result) == list(range(20))
+    assert max_tasks <= 4 + 1  # workers and the test task itself
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cgather_cancelled_closes_pending_tasks():
+    async def task(val):
+        await asyncio.sleep(1)
+        return val
+
+    tasks = [task(i) for i in range(100)]
+
+    gather_task = asyncio.create_task(cgather(*tasks, limit=2))
+    await asyncio.sleep(0.01)
+    gather_task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await gather_task
+
+    # started tasks are cancelled, the rest are closed without ever running
+    assert all(inspect.getcoroutinestate(t) == inspect.CORO_CLOSED for t in tasks)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cgather_rejects_zero_limit():
+    async def task(val):
+        return val
+
+    tasks = [task(i) for i in range(3)]
+
+    with pytest.raises(ValueError, match="at least 1"):
+        await cgather(*tasks, limit=0)
+
+    assert all(inspect.getcoroutinestate(t) == inspect.CORO_CLOSED for t in tasks)
@@ -1,18 +1,18 @@
-import asyncio
 from unittest.mock import AsyncMock, patch
 
+import aiohttp
 import pytest
 from aioresponses import aioresponses
 
 from aiohttp.client_exceptions import ClientError
-from aiohttp_socks import ProxyError
+from aiohttp_socks import ProxyConnector, ProxyError
 
 from app.models.proxy import Protocol
 from app.tasks.utils.network_request import (
-    HttpResult,
     ProxyHttpResult,
+    create_proxy_session,
     graceful_shutdown,
-    try_http_request,
+    http_request_lines,
     try_http_request_with_proxy,
 )
 
@@ -41,6 +41,50 @@ async def test_graceful_shutdown_no_protocol(mock_sleep):
     mock_sleep.assert_awaited_once_with(0)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_proxy_session_socks():
+    async with create_proxy_session("socks5://127.0.0.1:1080", Protocol.SOCKS5) as session:
+        assert isinstance(session.connector, ProxyConnector)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_proxy_session_http():
+    async with create_proxy_session("http://127.0.0.1:8080", Protocol.HTTP) as session:
+        assert not isinstance(session.connector, ProxyConnector)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_try_http_request_with_proxy_shared_session():
+    url = "http://example.com"
+    proxy_url = "http://127.0.0.1:8080"
+
+    with aioresponses() as mock:
+        mock.get(url, status=200, body="first")
+        mock.get(url, status=200, body="second")
+
+        async with create_proxy_session(proxy_url, Protocol.HTTP, proxy_timeout=1) as session:
+            first = await try_http_request_with_proxy(url, proxy_url, Protocol.HTTP, session=session)
+            second = await try_http_request_with_proxy(url, proxy_url, Protocol.HTTP, session=session)
+
+            assert not session.closed
+
+        assert first.text == "first"
+        assert second.text == "second"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("app.tasks.utils.network_request.ProxyConnector.from_url", side_effect=ValueError("bad proxy url"))
+async def test_try_http_request_with_proxy_session_creation_failure(mock_from_url):
+    result = await try_http_request_with_proxy("http://example.com", "socks5://127.0.0.1:1080", Protocol.SOCKS5)
+
+    assert result is None
+    mock_from_url.assert_called_once()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_try_http_request_with_proxy_http_success_http():
@@ -145,30 +189,60 @@ async def test_try_http_request_with_proxy_undef_exc():
         assert result is None
 
 
+async def collect_lines(url, **kwargs):
+    return [lines async for lines in http_request_lines(url, **kwargs)]
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_try_http_request_success():
+async def test_http_request_lines_success():
     url = "http://example.com"
-    expected_text = "Hello, World!"
 
     with aioresponses() as mock:
-        mock.get(url, status=200, body=expected_text)
+        mock.get(url, status=200, body="1.1.1.1:80\n2.2.2.2:8080\n3.3.3.3:1080")
 
-        result = await try_http_request(url)
+        batches = await collect_lines(url, chunk_size=7)
 
-        assert isinstance(result, HttpResult)
-        assert result.status == 200
-        assert result.text == expected_text
+    lines = [line for batch in batches for line in batch]
+    assert lines == ["1.1.1.1:80", "2.2.2.2:8080", "3.3.3.3:1080"]
+    assert len(batches) > 1
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_try_http_request_failure():
+async def test_http_request_lines_bad_status():
     url = "http://example.com"
 
     with aioresponses() as mock:
-        mock.get(url, exception=ConnectionError())
+        mock.get(url, status=404, body="1.1.1.1:80")
 
-        result = await try_http_request(url)
+        assert await collect_lines(url) == []
 
-        assert result is None
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_http_request_lines_failure():
+    url = "http://example.com"
+
+    with aioresponses() as mock:
+        mock.get(url, exception=ClientError())
+
+        with pytest.raises(ClientError):
+            await collect_lines(url)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_http_request_lines_reuses_session():
+    urls = ["http://example.com/a", "http://example.com/b"]
+
+    with aioresponses() as mock:
+        for url in urls:
+            mock.get(url, status=200, body="1.1.1.1:80")
+
+        async with aiohttp.ClientSession() as session:
+            for url in urls:
+                assert await collect_lines(url, session=session) == [["1.1.1.1:80"]]
+
+            # the session passed in is left open for the caller
+            assert not session.closed
@@ -17,8 +17,7 @@ def mock_reader():
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_geoip_get_geolocation_success(mock_reader):
+def test_geoip_get_geolocation_success(mock_reader):
     # Arrange
     ip = IPv4Address("8.8.8.8")
 
@@ -41,8 +40,7 @@ async def test_geoip_get_geolocation_success(mock_reader):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_geoip_get_geolocation_address_not_found(mock_reader):
+def test_geoip_get_geolocation_address_not_found(mock_reader):
     ip = IPv4Address("127.0.0.1")
     mock_reader.city.side_effect = AddressNotFoundError("Not found")
 
@@ -61,8 +59,7 @@ async def test_geoip_get_geolocation_address_not_found(mock_reader):
     ],
 )
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_geoip_get_geolocation_incomplete_data(mock_reader, city, region, country):
+def test_geoip_get_geolocation_incomplete_data(mock_reader, city, region, country):
     ip = IPv4Address("8.8.8.8")
 
     mock_response = Mock()
@@ -75,3 +72,31 @@ async def test_geoip_get_geolocation_incomplete_data(mock_reader, city, region,
     result = geoip.get_geolocation(ip)
 
     assert result is None
+
+
+@pytest.mark.unit
+def test_geoip_get_geolocation_is_cached(mock_reader):
+    mock_response = Mock()
+    mock_response.city.name = "Mountain View"
+    mock_response.subdivisions.most_specific.name = "California"
+    mock_response.country.iso_code = "US"
+    mock_reader.city.return_value = mock_response
+
+    geoip = GeoIP("dummy_path")
+
+    first = geoip.get_geolocation(IPv4Address("8.8.8.8"))
+    second = geoip.get_geolocation(IPv4Address("8.8.8.8"))
+
+    assert first == second
+    mock_reader.city.assert_called_once()
+
+
+@pytest.mark.unit
+def test_geoip_get_geolocation_caches_misses(mock_reader):
+    mock_reader.city.side_effect = AddressNotFoundError("Not found")
+
+    geoip = GeoIP("dummy_path")
+
+    assert geoip.get_geolocation(IPv4Address("127.0.0.1")) is None
+    assert geoip.get_geolocation(IPv4Address("127.0.0.1")) is None
+    mock_reader.city.assert_called_once()
@@ -0,0 +1,79 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.views import pages
+from app.views.utils.user_deps import is_logged_in
+
+
+@pytest.fixture
+def client():
+    pages._static_pages.clear()
+    return TestClient(app)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", ["/", "/api", "/login"])
+def test_static_page_etag(client: TestClient, path: str):
+    response = client.get(path)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["cache-control"] == pages.STATIC_PAGE_CACHE_CONTROL
+
+    etag = response.headers["etag"]
+    assert etag
+
+    response = client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not response.content
+    assert response.headers["etag"] == etag
+
+    response = client.get(path, headers={"If-None-Match": '"outdated"'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "if_none_match",
+    ["W/{etag}", '"outdated", {etag}', '"outdated",W/{etag}', "*"],
+    ids=["weak", "list", "weak-in-list", "any"],
+)
+def test_static_page_etag_weak_comparison(client: TestClient, if_none_match: str):
+    etag = client.get("/").headers["etag"]
+
+    response = client.get("/", headers={"If-None-Match": if_none_match.format(etag=etag)})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.unit
+def test_static_page_cached_per_host(client: TestClient):
+    first = client.get("/login")
+    second = client.get("/login", headers={"Host": "example.com"})
+
+    assert "http://testserver/" in first.text
+    assert "http://example.com/" in second.text
+    assert first.headers["etag"] != second.headers["etag"]
+    assert len(pages._static_pages) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", ["/dashboard", "/source", "/user"])
+def test_private_page(client: TestClient, path: str):
+    app.dependency_overrides[is_logged_in] = lambda: True
+    try:
+        response = client.get(path)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["cache-control"] == pages.PRIVATE_PAGE_CACHE_CONTROL
+
+        response = client.get(path, headers={"If-None-Match": response.headers["etag"]})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        app.dependency_overrides[is_logged_in] = lambda: False
+
+        response = client.get(path, headers={"If-None-Match": response.headers["etag"]}, follow_redirects=False)
+        assert response.status_code == status.HTTP_302_FOUND
+        assert response.headers["location"] == "http://testserver/login"
+    finally:
+        app.dependency_overrides.clear()
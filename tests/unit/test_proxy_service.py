@@ -1,29 +1,20 @@
 from datetime import datetime, timezone
 from ipaddress import IPv4Address
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, patch, sentinel
 from uuid import uuid4
 
 import pytest
-import pytest_asyncio
 
 from app.core.exceptions import CountryCodeError, LogicError
-from app.core.uow import SQLUnitOfWork
 from app.models.country import Country
 from app.models.proxy import Protocol, Proxy, ProxyAddress, ProxyHealth
 from app.service.proxy import InitialHealth, Location, NotFoundError, ProxyService
 
+TESTED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-@pytest_asyncio.fixture(loop_scope="function", scope="function")
-async def mock_uow() -> AsyncMock:
-    uow = AsyncMock(SQLUnitOfWork)
-    uow.__aenter__.return_value = uow
-    uow.proxy_repository = AsyncMock()
-    uow.source_repository = AsyncMock()
-    return uow
 
-
-@pytest_asyncio.fixture(loop_scope="function", scope="function")
-async def service(mock_uow: AsyncMock) -> ProxyService:
+@pytest.fixture
+def service(mock_uow: AsyncMock) -> ProxyService:
     return ProxyService(mock_uow)
 
 
@@ -52,76 +43,55 @@ async def test_create_proxy(service: ProxyService, mock_uow: AsyncMock) -> None:
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_get_by_id(service: ProxyService, mock_uow: AsyncMock) -> None:
-    proxy_id = uuid4()
-    mock_proxy = Proxy()
-    mock_proxy.id = proxy_id
-
-    mock_uow.proxy_repository.get_by_id.return_value = mock_proxy
-    result = await service.get_by_id(proxy_id)
-
-    mock_uow.proxy_repository.get_by_id.assert_called_once_with(proxy_id)
-    assert result == mock_proxy
+@pytest.mark.parametrize(
+    ("method", "args", "returns_result"),
+    [
+        ("get_by_id", (uuid4(),), True),
+        ("update", (sentinel.proxy,), True),
+        ("remove", (sentinel.proxy,), False),
+        ("get_proxies", (), True),
+        ("get_proxies_count", (), True),
+        ("get_countries", (), True),
+    ],
+    ids=["get_by_id", "update", "remove", "get_proxies", "get_proxies_count", "get_countries"],
+)
+async def test_delegates_to_repository(
+    service: ProxyService,
+    mock_uow: AsyncMock,
+    method: str,
+    args: tuple[object, ...],
+    returns_result: bool,
+) -> None:
+    repository_method = getattr(mock_uow.proxy_repository, method)
+    repository_method.return_value = sentinel.result
+
+    result = await getattr(service, method)(*args)
+
+    repository_method.assert_awaited_once()
+    assert repository_method.await_args.args == args
+    assert result is (sentinel.result if returns_result else None)
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_update_proxy(service: ProxyService, mock_uow: AsyncMock) -> None:
-    mock_proxy = Proxy()
-    mock_uow.proxy_repository.update.return_value = mock_proxy
-
-    result = await service.update(mock_proxy)
-
-    mock_uow.proxy_repository.update.assert_called_once_with(mock_proxy)
-    assert result == mock_proxy
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_remove_proxy(service: ProxyService, mock_uow: AsyncMock) -> None:
-    mock_proxy = Proxy()
-
-    await service.remove(mock_proxy)
-
-    mock_uow.proxy_repository.remove.assert_called_once_with(mock_proxy)
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_proxies(service: ProxyService, mock_uow: AsyncMock) -> None:
-    await service.get_proxies()
-
-    mock_uow.proxy_repository.get_proxies.assert_called_once()
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_proxies_logic_exception(service: ProxyService, mock_uow: AsyncMock) -> None:
-    with pytest.raises(LogicError):
-        await service.get_proxies(sort_by_unchecked=True, only_checked=True)
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_proxies_country_exception(service: ProxyService, mock_uow: AsyncMock) -> None:
-    with pytest.raises(CountryCodeError):
-        await service.get_proxies(country_alpha2_code="INVALIDCOUNTRYCODE")
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_proxies_count(service: ProxyService, mock_uow: AsyncMock) -> None:
-    await service.get_proxies_count()
-
-    mock_uow.proxy_repository.get_proxies_count.assert_called_once()
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_countries(service: ProxyService, mock_uow: AsyncMock) -> None:
-    await service.get_countries()
-
-    mock_uow.proxy_repository.get_countries.assert_called_once()
+@pytest.mark.parametrize(
+    ("kwargs", "exception"),
+    [
+        ({"sort_by_unchecked": True, "only_checked": True}, LogicError),
+        ({"country_alpha2_code": "INVALIDCOUNTRYCODE"}, CountryCodeError),
+    ],
+    ids=["unchecked_and_checked", "invalid_country_code"],
+)
+async def test_get_proxies_exception(
+    service: ProxyService,
+    mock_uow: AsyncMock,
+    kwargs: dict[str, object],
+    exception: type[Exception],
+) -> None:
+    with pytest.raises(exception):
+        await service.get_proxies(**kwargs)
+
+    mock_uow.proxy_repository.get_proxies.assert_not_called()
 
 
 @pytest.mark.unit
@@ -187,7 +157,7 @@ async def test_update_bulk(service: ProxyService, mock_uow: AsyncMock) -> None:
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_build(service: ProxyService, mock_uow: AsyncMock) -> None:
+async def test_build(service: ProxyService) -> None:
     ip_address = IPv4Address("10.0.0.1")
     port = 3128
     protocol = Protocol.HTTPS
@@ -211,14 +181,14 @@ async def test_build(service: ProxyService, mock_uow: AsyncMock) -> None:
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_build_with_health(service: ProxyService, mock_uow: AsyncMock) -> None:
+async def test_build_with_health(service: ProxyService) -> None:
     ip_address = IPv4Address("10.0.0.1")
     port = 3128
     protocol = Protocol.HTTPS
     login = "user"
     password = "pass"
     latency = 123
-    tested_at = datetime.now(tz=timezone.utc)
+    tested_at = TESTED_AT
 
     proxy = await service._build(
         address=ip_address,
@@ -244,7 +214,7 @@ async def test_build_with_health(service: ProxyService, mock_uow: AsyncMock) ->
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_build_with_health_and_location(service: ProxyService, mock_uow: AsyncMock) -> None:
+async def test_build_with_health_and_location(service: ProxyService) -> None:
     location = Location(city="TestCity", region="TestRegion", country_code="US")
     ip_address = IPv4Address("10.0.0.1")
     port = 3128
@@ -252,7 +222,7 @@ async def test_build_with_health_and_location(service: ProxyService, mock_uow: A
     login = "user"
     password = "pass"
     latency = 123
-    tested_at = datetime.now(tz=timezone.utc)
+    tested_at = TESTED_AT
 
     fake_geo_address = ProxyAddress()
     fake_geo_address.id = uuid4()
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from argon2 import PasswordHasher as Argon2Hasher
 from argon2.exceptions import Argon2Error, InvalidHashError, VerifyMismatchError
 from jwt import encode as jwt_encode
 from jwt.exceptions import PyJWTError
@@ -9,56 +10,50 @@ from app.core.exceptions import HashingError
 from app.core.security import JWT, PasswordHasher, TokenError
 
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_password_hasher_hash() -> None:
-    plaintext = "abc"
-
-    hashed = PasswordHasher.hash(plaintext)
-    assert hashed
-    assert isinstance(hashed, str)
-    assert hashed != plaintext
+@pytest.fixture(scope="module")
+def hashed_abc() -> str:
+    # argon2 is deliberately slow, so hash once for all tests in the module
+    return PasswordHasher.hash("abc")
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_password_hasher_verify() -> None:
-    plaintext = "abc"
-
-    hashed = PasswordHasher.hash(plaintext)
-
-    assert PasswordHasher.verify(hashed, plaintext) == True
+def test_password_hasher_hash(hashed_abc: str) -> None:
+    assert hashed_abc
+    assert isinstance(hashed_abc, str)
+    assert hashed_abc != "abc"
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_password_hasher_verify_wrong_password() -> None:
-    plaintext = "abc"
-    plaintext_wrong = "xyz"
-
-    hashed = PasswordHasher.hash(plaintext)
-
-    assert PasswordHasher.verify(hashed, plaintext_wrong) == False
+def test_password_hasher_verify(hashed_abc: str) -> None:
+    assert PasswordHasher.verify(hashed_abc, "abc") == True
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_password_hasher_raises_hashing_error(monkeypatch):
-    from argon2 import PasswordHasher as Argon2Hasher
+def test_password_hasher_verify_wrong_password(hashed_abc: str) -> None:
+    assert PasswordHasher.verify(hashed_abc, "xyz") == False
 
-    def broken_hash(self, password):
-        raise Argon2Error("something went wrong")
 
-    monkeypatch.setattr(Argon2Hasher, "hash", broken_hash)
-    with pytest.raises(HashingError, match="Failed to hash password"):
-        PasswordHasher.hash("password")
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("method", "args", "error", "match"),
+    [
+        ("hash", ("password",), Argon2Error("something went wrong"), "Failed to hash password"),
+        ("verify", ("invalid_hash", "password"), InvalidHashError("bad hash"), "Failed to verify password"),
+        ("verify", ("some_hash", "password"), Argon2Error("generic error"), "Failed to verify password"),
+    ],
+    ids=["hash_argon2_error", "verify_invalid_hash", "verify_argon2_error"],
+)
+def test_password_hasher_raises_hashing_error(monkeypatch, method, args, error, match):
+    def broken(self, *args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(Argon2Hasher, method, broken)
+    with pytest.raises(HashingError, match=match):
+        getattr(PasswordHasher, method)(*args)
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_password_hasher_verify_mismatch_failure(monkeypatch):
-    from argon2 import PasswordHasher as Argon2Hasher
-
+def test_password_hasher_verify_mismatch_failure(monkeypatch):
     def broken_verify(self, hash, password):
         raise VerifyMismatchError("mismatch error")
 
@@ -67,34 +62,7 @@ async def test_password_hasher_verify_mismatch_failure(monkeypatch):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_password_hasher_verify_raises_hashing_error_on_invalid_hash(monkeypatch):
-    from argon2 import PasswordHasher as Argon2Hasher
-
-    def broken_verify(self, hash, password):
-        raise InvalidHashError("bad hash")
-
-    monkeypatch.setattr(Argon2Hasher, "verify", broken_verify)
-    with pytest.raises(HashingError, match="Failed to verify password"):
-        PasswordHasher.verify("invalid_hash", "password")
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_password_hasher_verify_raises_hashing_error_on_generic_argon2(monkeypatch):
-    from argon2 import PasswordHasher as Argon2Hasher
-
-    def broken_verify(self, hash, password):
-        raise Argon2Error("generic error")
-
-    monkeypatch.setattr(Argon2Hasher, "verify", broken_verify)
-    with pytest.raises(HashingError, match="Failed to verify password"):
-        PasswordHasher.verify("some_hash", "password")
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_jwt_encode_valid(monkeypatch):
+def test_jwt_encode_valid(monkeypatch):
     user_id = "user123"
     token = JWT.encode(user_id)
     assert isinstance(token, str)
@@ -104,8 +72,7 @@ async def test_jwt_encode_valid(monkeypatch):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_jwt_encode_token_error(monkeypatch):
+def test_jwt_encode_token_error(monkeypatch):
     def patched_encode(payload, key, algorithm):
         raise PyJWTError("payload error")
         return jwt_encode(payload=payload, key=key, algorithm=algorithm)
@@ -118,22 +85,21 @@ async def test_jwt_encode_token_error(monkeypatch):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_jwt_decode_invalid(monkeypatch):
-    with pytest.raises(TokenError, match="Invalid token"):
-        JWT.decode("not.a.valid.token")
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_jwt_decode_empty():
-    with pytest.raises(TokenError, match="Token is empty"):
-        JWT.decode("")
+@pytest.mark.parametrize(
+    ("token", "match"),
+    [
+        ("not.a.valid.token", "Invalid token"),
+        ("", "Token is empty"),
+    ],
+    ids=["invalid", "empty"],
+)
+def test_jwt_decode_bad_token(token, match):
+    with pytest.raises(TokenError, match=match):
+        JWT.decode(token)
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_jwt_decode_expired(monkeypatch):
+def test_jwt_decode_expired(monkeypatch):
     expired_payload = {
         "sub": "user123",
         "iat": datetime(2000, 1, 1, tzinfo=timezone.utc) - timedelta(minutes=10),
@@ -153,11 +119,11 @@ async def test_jwt_decode_expired(monkeypatch):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_jwt_decode_missing_sub(monkeypatch):
+def test_jwt_decode_missing_sub(monkeypatch):
+    now = datetime.now(timezone.utc)
     payload_missing = {
-        "exp": datetime.now(timezone.utc) + timedelta(minutes=5),
-        "iat": datetime.now(timezone.utc),
+        "exp": now + timedelta(minutes=5),
+        "iat": now,
         # "sub" is missing
     }
 
@@ -171,3 +137,13 @@ async def test_jwt_decode_missing_sub(monkeypatch):
 
     with pytest.raises(TokenError, match="Invalid token payload"):
         JWT.decode(token)
+
+
+@pytest.mark.unit
+def test_jwt_decode_with_expiry():
+    token = JWT.encode("user123")
+
+    user_id, expiry = JWT.decode_with_expiry(token)
+
+    assert user_id == "user123"
+    assert expiry > datetime.now(timezone.utc).timestamp()
@@ -2,25 +2,14 @@ from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
-import pytest_asyncio
 
 from app.core.exceptions import AlreadyExistsError
-from app.core.uow import SQLUnitOfWork
 from app.models.source import Source, SourceType
 from app.service.source import SourceService
 
 
-@pytest_asyncio.fixture(loop_scope="function", scope="function")
-async def mock_uow() -> AsyncMock:
-    uow = AsyncMock(SQLUnitOfWork)
-    uow.__aenter__.return_value = uow
-    uow.proxy_repository = AsyncMock()
-    uow.source_repository = AsyncMock()
-    return uow
-
-
-@pytest_asyncio.fixture(loop_scope="function", scope="function")
-async def service(mock_uow: AsyncMock) -> SourceService:
+@pytest.fixture
+def service(mock_uow: AsyncMock) -> SourceService:
     return SourceService(mock_uow)
 
 
@@ -110,6 +99,16 @@ async def test_update_source(service: SourceService, mock_uow: AsyncMock) -> Non
     assert result == mock_source
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_bulk(service: SourceService, mock_uow: AsyncMock) -> None:
+    sources = [Source(), Source()]
+
+    await service.update_bulk(sources, only_health=True)
+
+    mock_uow.source_repository.update_bulk.assert_called_once_with(sources, only_health=True)
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_remove_source(service: SourceService, mock_uow: AsyncMock) -> None:
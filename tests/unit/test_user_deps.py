@@ -0,0 +1,124 @@
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.exceptions import TokenError
+from app.core.login_cache import LOGGED_IN_CACHE_TTL, clear_logged_in_cache, forget_access_token, get_cached_user_id
+from app.models.user import User
+from app.views.utils.user_deps import is_logged_in
+
+TOKEN_EXPIRY = 4102444800.0  # 2100-01-01
+
+
+def make_request(access_token: str | None) -> Mock:
+    request = Mock()
+    request.cookies = {"access_token": access_token} if access_token else {}
+    return request
+
+
+@pytest.fixture(autouse=True)
+def empty_logged_in_cache():
+    clear_logged_in_cache()
+    yield
+    clear_logged_in_cache()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_is_logged_in_without_token():
+    user_service = AsyncMock()
+
+    assert not await is_logged_in(make_request(None), user_service)
+    user_service.get_by_id.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_is_logged_in_invalid_token():
+    user_service = AsyncMock()
+
+    with patch("app.views.utils.user_deps.JWT.decode_with_expiry", side_effect=TokenError("invalid")):
+        assert not await is_logged_in(make_request("token"), user_service)
+
+    user_service.get_by_id.assert_not_called()
+    assert get_cached_user_id("token") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_is_logged_in_caches_token():
+    user = User(id=uuid4(), login="user", password="password")
+    user_service = AsyncMock()
+    user_service.get_by_id.return_value = user
+
+    with patch(
+        "app.views.utils.user_deps.JWT.decode_with_expiry", return_value=(str(user.id), TOKEN_EXPIRY)
+    ) as mock_decode:
+        assert await is_logged_in(make_request("token"), user_service)
+        assert await is_logged_in(make_request("token"), user_service)
+
+    mock_decode.assert_called_once_with("token")
+    user_service.get_by_id.assert_called_once_with(user.id)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_is_logged_in_cache_expires():
+    user = User(id=uuid4(), login="user", password="password")
+    user_service = AsyncMock()
+    user_service.get_by_id.return_value = user
+
+    expired = LOGGED_IN_CACHE_TTL + 1
+    with (
+        patch("app.views.utils.user_deps.JWT.decode_with_expiry", return_value=(str(user.id), TOKEN_EXPIRY)),
+        patch("app.core.login_cache.time.time", side_effect=[0.0, expired, expired]),
+    ):
+        assert await is_logged_in(make_request("token"), user_service)
+        assert await is_logged_in(make_request("token"), user_service)
+
+    assert user_service.get_by_id.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_is_logged_in_cache_does_not_outlive_token():
+    user = User(id=uuid4(), login="user", password="password")
+    user_service = AsyncMock()
+    user_service.get_by_id.return_value = user
+
+    with (
+        patch("app.views.utils.user_deps.JWT.decode_with_expiry", return_value=(str(user.id), 5.0)),
+        patch("app.core.login_cache.time.time", side_effect=[0.0, 6.0, 6.0]),
+    ):
+        assert await is_logged_in(make_request("token"), user_service)
+        assert await is_logged_in(make_request("token"), user_service)
+
+    assert user_service.get_by_id.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_is_logged_in_unknown_user_not_cached():
+    user_service = AsyncMock()
+    user_service.get_by_id.return_value = None
+
+    with patch("app.views.utils.user_deps.JWT.decode_with_expiry", return_value=(str(uuid4()), TOKEN_EXPIRY)):
+        assert not await is_logged_in(make_request("token"), user_service)
+
+    assert get_cached_user_id("token") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_forget_access_token():
+    user = User(id=uuid4(), login="user", password="password")
+    user_service = AsyncMock()
+    user_service.get_by_id.return_value = user
+
+    with patch("app.views.utils.user_deps.JWT.decode_with_expiry", return_value=(str(user.id), TOKEN_EXPIRY)):
+        assert await is_logged_in(make_request("token"), user_service)
+        forget_access_token("token")
+        assert await is_logged_in(make_request("token"), user_service)
+
+    assert user_service.get_by_id.call_count == 2
@@ -2,24 +2,14 @@ from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
-import pytest_asyncio
 
 from app.core.exceptions import AlreadyExistsError
-from app.core.uow import SQLUnitOfWork
 from app.models.user import User
 from app.service.user import UserService
 
 
-@pytest_asyncio.fixture(loop_scope="function", scope="function")
-async def mock_uow() -> AsyncMock:
-    uow = AsyncMock(SQLUnitOfWork)
-    uow.__aenter__.return_value = uow
-    uow.user_repository = AsyncMock()
-    return uow
-
-
-@pytest_asyncio.fixture(loop_scope="function", scope="function")
-async def service(mock_uow: AsyncMock) -> UserService:
+@pytest.fixture
+def service(mock_uow: AsyncMock) -> UserService:
     return UserService(mock_uow)
 
 